@@ -2,23 +2,67 @@
 SimURF Analyzer Application
 Collects and analyzes metrics from RF simulator.
 """
+import atexit
 import sys
 import socket
 import json
 import logging
 import argparse
+import queue
+import threading
 from typing import Dict, Any
 from collections import deque
 import time
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='[%(asctime)s] [Analyzer] %(levelname)s: %(message)s',
+import numpy as np
+
+from shared.net_utils import BatchReceiver, recvmmsg_available
+
+# orjson parses the small metric datagrams several times faster than
+# stdlib json and accepts raw bytes, skipping the UTF-8 decode pass.
+try:
+    from orjson import loads as _json_loads, dumps as _json_dumps
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj):
+        return json.dumps(obj).encode()
+
+# Configure logging. Records are handed to a QueueListener so
+# formatting and the stderr write happen off the packet-processing
+# threads; per-packet detail is logged at DEBUG and skipped entirely
+# at the default INFO level.
+from logging.handlers import QueueHandler, QueueListener
+
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter(
+    '[%(asctime)s] [Analyzer] %(levelname)s: %(message)s',
     datefmt='%H:%M:%S'
-)
+))
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_listener = QueueListener(_log_queue, _log_handler)
+_log_listener.start()
+# The listener thread is a daemon: without an explicit stop, records
+# still queued at interpreter exit (including the final summary) are
+# silently discarded.
+atexit.register(_log_listener.stop)
+
+# The queue handler only merges args into the message; the listener's
+# handler applies the real format string.
+_queue_handler = QueueHandler(_log_queue)
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+
+logging.basicConfig(level=logging.INFO, handlers=[_queue_handler])
 logger = logging.getLogger(__name__)
 
+# Emit the INFO-level running statistics every this many packets
+STATS_INTERVAL = 100
+
+# Metrics datagrams are small JSON objects; sizing the receive slots at
+# 2 KiB instead of the UDP maximum keeps the whole batch ring hot in
+# cache. Larger datagrams are truncated (and rejected as invalid JSON).
+METRICS_DATAGRAM_MAX = 2048
+
 
 class SimURFAnalyzer:
     """Real-time metrics analyzer."""
@@ -28,36 +72,79 @@ class SimURFAnalyzer:
         listen_ip: str = "0.0.0.0",
         listen_port: int = 7000,
         window_size: int = 100,
-        output_file: str = "metrics.json"
+        output_file: str = "metrics.json",
+        recv_batch_size: int = 64,
+        workers: int = 1,
+        queue_depth: int = 10000,
+        num_sockets: int = 1,
+        rcvbuf_bytes: int = 8 << 20
     ):
         """
         Initialize analyzer.
-        
+
         Args:
             listen_ip: IP to bind to
             listen_port: Port to listen on
             window_size: Number of metrics to keep in memory
             output_file: JSON file to save metrics
+            recv_batch_size: Max datagrams pulled per recvmmsg syscall
+            workers: Number of worker threads parsing/processing metrics
+            queue_depth: Bounded queue size between reader and workers
+            num_sockets: Reader sockets sharing the port via SO_REUSEPORT
+            rcvbuf_bytes: Requested kernel receive buffer per socket
         """
         self.listen_ip = listen_ip
         self.listen_port = listen_port
         self.window_size = window_size
         self.output_file = output_file
+        self.recv_batch_size = recv_batch_size
+        self.workers = workers
+
+        # Bounded hand-off queue: the reader thread only receives and
+        # enqueues, so the socket drains at line rate while workers do
+        # the JSON parsing and statistics.
+        self._queue: queue.Queue = queue.Queue(maxsize=queue_depth)
+        self._lock = threading.Lock()
+        self.dropped_count = 0
         
-        # Metrics storage
+        # Metrics storage. The deque of raw dicts is kept only for the
+        # archival JSON dump; window statistics run over columnar NumPy
+        # ring buffers (struct-of-arrays) so the reductions happen on
+        # packed floats in C instead of per-dict Python lookups.
         self.metrics_history: deque = deque(maxlen=window_size)
         self.packet_count = 0
         self.start_time = time.time()
+
+        self._ber = np.full(window_size, np.nan, dtype=np.float32)
+        self._byte_errors = np.zeros(window_size, dtype=np.int32)
+        self._ring_idx = 0
+        self._ring_count = 0
         
-        # Setup socket
-        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-        self.sock.bind((listen_ip, listen_port))
+        # Setup reader sockets. With more than one socket, SO_REUSEPORT
+        # lets the kernel spread datagrams over independent receive
+        # queues so a single full queue no longer forces drops.
+        if num_sockets > 1 and not hasattr(socket, "SO_REUSEPORT"):
+            logger.warning("SO_REUSEPORT unavailable, using a single socket")
+            num_sockets = 1
+        self.num_sockets = num_sockets
+
+        self.socks = []
+        for _ in range(num_sockets):
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            if num_sockets > 1:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, rcvbuf_bytes)
+            sock.bind((listen_ip, listen_port))
+            self.socks.append(sock)
+        self.sock = self.socks[0]
         
         logger.info("=" * 70)
         logger.info(f"SimURF Analyzer Started")
         logger.info(f"Listening: {listen_ip}:{listen_port}")
         logger.info(f"Window size: {window_size} packets")
         logger.info(f"Output: {output_file}")
+        logger.info(f"Batched receive: "
+                   f"{'recvmmsg x' + str(recv_batch_size) if recvmmsg_available() else 'unavailable (recvfrom fallback)'}")
         logger.info("=" * 70)
     
     def process_metrics(self, metrics: Dict[str, Any]):
@@ -69,56 +156,106 @@ class SimURFAnalyzer:
         """
         self.packet_count += 1
         self.metrics_history.append(metrics)
-        
-        logger.info(f"\n{'─' * 70}")
-        logger.info(f"Metrics #{self.packet_count}")
-        logger.info(f"  SNR: {metrics.get('snr_db', 'N/A')} dB")
-        logger.info(f"  Doppler: {metrics.get('doppler', 'N/A')} Hz")
-        logger.info(f"  Channel: {metrics.get('channel_model', 'N/A')}")
-        
-        if 'ber' in metrics:
-            logger.info(f"  BER: {metrics['ber']:.6f}")
-            logger.info(f"  Bit errors: {metrics.get('bit_errors', 0)}")
-        
-        if 'byte_errors' in metrics:
-            logger.info(f"  Byte errors: {metrics['byte_errors']}")
-        
-        # Calculate running statistics
-        if len(self.metrics_history) >= 10:
+        self._record(metrics)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"\n{'─' * 70}")
+            logger.debug(f"Metrics #{self.packet_count}")
+            logger.debug(f"  SNR: {metrics.get('snr_db', 'N/A')} dB")
+            logger.debug(f"  Doppler: {metrics.get('doppler', 'N/A')} Hz")
+            logger.debug(f"  Channel: {metrics.get('channel_model', 'N/A')}")
+
+            if 'ber' in metrics:
+                logger.debug(f"  BER: {metrics['ber']:.6f}")
+                logger.debug(f"  Bit errors: {metrics.get('bit_errors', 0)}")
+
+            if 'byte_errors' in metrics:
+                logger.debug(f"  Byte errors: {metrics['byte_errors']}")
+
+        # Periodic running statistics (kept at INFO, but throttled)
+        if (len(self.metrics_history) >= 10
+                and self.packet_count % STATS_INTERVAL == 0):
             self._print_statistics()
     
+    def _record(self, metrics: Dict[str, Any]):
+        """
+        Write one metrics entry into the columnar ring buffers.
+
+        Args:
+            metrics: Newly received metrics entry
+        """
+        idx = self._ring_idx
+        self._ber[idx] = metrics.get('ber', np.nan)
+        self._byte_errors[idx] = metrics.get('byte_errors', 0)
+        self._ring_idx = (idx + 1) % self.window_size
+        self._ring_count = min(self._ring_count + 1, self.window_size)
+
+    def _window_columns(self):
+        """Valid slices of the BER / byte-error ring buffers."""
+        n = self._ring_count
+        return self._ber[:n], self._byte_errors[:n]
+
     def _print_statistics(self):
         """Print running statistics."""
-        bers = [m.get('ber', 0) for m in self.metrics_history if 'ber' in m]
-        
-        if bers:
-            avg_ber = sum(bers) / len(bers)
-            max_ber = max(bers)
-            min_ber = min(bers)
-            
+        ber, byte_errors = self._window_columns()
+        have_ber = np.count_nonzero(~np.isnan(ber))
+
+        if have_ber:
             logger.info(f"\n  Running stats (last {len(self.metrics_history)} packets):")
-            logger.info(f"    BER: avg={avg_ber:.6f}, min={min_ber:.6f}, max={max_ber:.6f}")
-            
-            # Calculate packet error rate
-            errors = [m for m in self.metrics_history if m.get('byte_errors', 0) > 0]
-            per = len(errors) / len(self.metrics_history)
-            logger.info(f"    PER: {per:.4f} ({len(errors)}/{len(self.metrics_history)})")
+            logger.info(f"    BER: avg={np.nanmean(ber):.6f}, "
+                       f"min={np.nanmin(ber):.6f}, max={np.nanmax(ber):.6f}")
+
+            err_count = int(np.count_nonzero(byte_errors > 0))
+            per = err_count / len(self.metrics_history)
+            logger.info(f"    PER: {per:.4f} ({err_count}/{len(self.metrics_history)})")
     
+    def _process_loop(self):
+        """Worker loop: parse queued datagrams and update statistics."""
+        while True:
+            data, addr = self._queue.get()
+
+            try:
+                metrics = _json_loads(data)
+            except ValueError as e:
+                logger.error(f"✗ Invalid JSON: {e}")
+                continue
+
+            try:
+                with self._lock:
+                    self.process_metrics(metrics)
+            except Exception as e:
+                logger.error(f"✗ Processing error: {e}")
+
+    def _recv_loop(self, sock: socket.socket):
+        """Reader loop: drain one socket into the hand-off queue."""
+        receiver = BatchReceiver(
+            sock,
+            batch_size=self.recv_batch_size,
+            buffer_size=METRICS_DATAGRAM_MAX
+        )
+
+        while True:
+            for item in receiver.recv_batch():
+                try:
+                    self._queue.put_nowait(item)
+                except queue.Full:
+                    # Shed load rather than stall the socket reader
+                    self.dropped_count += 1
+
     def run(self):
-        """Main receive loop."""
-        buffer_size = 65535
-        
+        """Main receive loop: drain the sockets and hand off to workers."""
+        for _ in range(self.workers):
+            threading.Thread(target=self._process_loop, daemon=True).start()
+
+        # Extra sockets get their own reader threads; the first socket
+        # is read on the main thread so Ctrl-C still works.
+        for sock in self.socks[1:]:
+            threading.Thread(
+                target=self._recv_loop, args=(sock,), daemon=True
+            ).start()
+
         try:
-            while True:
-                data, addr = self.sock.recvfrom(buffer_size)
-                
-                try:
-                    metrics = json.loads(data.decode())
-                    self.process_metrics(metrics)
-                except json.JSONDecodeError as e:
-                    logger.error(f"✗ Invalid JSON: {e}")
-                except Exception as e:
-                    logger.error(f"✗ Processing error: {e}")
+            self._recv_loop(self.socks[0])
                     
         except KeyboardInterrupt:
             logger.info("\nShutting down...")
@@ -132,13 +269,19 @@ class SimURFAnalyzer:
     
     def _save_metrics(self):
         """Save metrics to file."""
+        # Stream one record at a time instead of materializing the whole
+        # window as a second list plus one giant JSON string; extra
+        # memory stays O(1) even for very large --window-size values.
         try:
-            with open(self.output_file, 'w') as f:
-                json.dump({
-                    'packet_count': self.packet_count,
-                    'runtime_s': time.time() - self.start_time,
-                    'metrics': list(self.metrics_history)
-                }, f, indent=2)
+            runtime = time.time() - self.start_time
+            with open(self.output_file, 'wb') as f:
+                f.write(b'{"packet_count": %d, "runtime_s": %f, "metrics": ['
+                        % (self.packet_count, runtime))
+                for i, metrics in enumerate(self.metrics_history):
+                    if i:
+                        f.write(b',')
+                    f.write(_json_dumps(metrics))
+                f.write(b']}')
             logger.info(f"Metrics saved to: {self.output_file}")
         except Exception as e:
             logger.error(f"✗ Could not save metrics: {e}")
@@ -151,6 +294,7 @@ class SimURFAnalyzer:
         logger.info("FINAL SUMMARY")
         logger.info("=" * 70)
         logger.info(f"Total packets:  {self.packet_count}")
+        logger.info(f"Dropped (queue):{self.dropped_count}")
         logger.info(f"Runtime:        {runtime:.2f} s")
         logger.info(f"Throughput:     {self.packet_count / runtime:.2f} pps")
         
@@ -164,17 +308,21 @@ class SimURFAnalyzer:
                 logger.info(f"  Minimum: {min(bers):.6f}")
                 logger.info(f"  Maximum: {max(bers):.6f}")
             
-            # Packet error rate
-            errors = [m for m in self.metrics_history if m.get('byte_errors', 0) > 0]
-            per = len(errors) / len(self.metrics_history)
+            # Packet error rate; count without materializing a list of
+            # the matching dicts
+            err_count = sum(
+                1 for m in self.metrics_history if m.get('byte_errors', 0) > 0
+            )
+            per = err_count / len(self.metrics_history)
             logger.info(f"\nPacket Error Rate: {per:.4f}")
-            logger.info(f"  Packets with errors: {len(errors)}/{len(self.metrics_history)}")
+            logger.info(f"  Packets with errors: {err_count}/{len(self.metrics_history)}")
         
         logger.info("=" * 70)
     
     def close(self):
         """Clean up resources."""
-        self.sock.close()
+        for sock in self.socks:
+            sock.close()
         logger.info("Analyzer closed")
 
 
@@ -203,15 +351,29 @@ def main():
         default="metrics.json",
         help="Output JSON file"
     )
-    
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Number of metric-processing worker threads"
+    )
+    parser.add_argument(
+        "--sockets",
+        type=int,
+        default=1,
+        help="Number of SO_REUSEPORT reader sockets"
+    )
+
     args = parser.parse_args()
-    
+
     # Create and run analyzer
     analyzer = SimURFAnalyzer(
         listen_ip=args.listen_ip,
         listen_port=args.listen_port,
         window_size=args.window_size,
-        output_file=args.output
+        output_file=args.output,
+        workers=args.workers,
+        num_sockets=args.sockets
     )
     
     try:
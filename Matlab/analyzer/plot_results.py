@@ -1,18 +1,15 @@
-import csv
 import matplotlib.pyplot as plt
+import numpy as np
 
-packets = []
-per = []
-ber = []
-latency = []
+# Bulk-parse the CSV in NumPy's C loop instead of converting each row
+# through csv.DictReader; columns land as contiguous arrays that plot
+# directly.
+data = np.genfromtxt("metrics.csv", delimiter=",", names=True)
 
-with open("metrics.csv") as f:
-    reader = csv.DictReader(f)
-    for row in reader:
-        packets.append(int(row["packets"]))
-        per.append(float(row["PER"]))
-        ber.append(float(row["BER"]))
-        latency.append(float(row["avg_latency"]))
+packets = data["packets"].astype(int)
+per = data["PER"]
+ber = data["BER"]
+latency = data["avg_latency"]
 
 # PER plot
 plt.figure()
@@ -2,22 +2,28 @@
 SimURF Receiver Application
 Receives packets from MATLAB RF simulator and processes them.
 """
+import os
 import sys
 import socket
 import time
+import queue
 import logging
 import argparse
+import threading
 from typing import Optional
 
 from shared.packet_format import unpack
 from shared.crypto_utils import decrypt
 from shared.fec_utils import fec_decode_with_stats
 from shared.config_utils import SimURFConfig, ConfigurationError
-from shared.metrics import MetricsCollector, PacketMetrics, PerformanceMonitor
+from shared.metrics import MetricsCollector, PerformanceMonitor
+from shared.net_utils import BatchReceiver, PacketBufferPool, recvmmsg_available
 
-# Configure logging
+# Per-packet detail is DEBUG-only so the hot loop skips the string
+# formatting and handler dispatch entirely at the default level. Set
+# SIMURF_VERBOSE=1 to restore the packet-by-packet trace.
 logging.basicConfig(
-    level=logging.INFO,
+    level=logging.DEBUG if os.environ.get("SIMURF_VERBOSE") else logging.INFO,
     format='[%(asctime)s] [Receiver] %(levelname)s: %(message)s',
     datefmt='%H:%M:%S'
 )
@@ -56,14 +62,46 @@ class SimURFReceiver:
         self.success_count = 0
         self.crc_errors = 0
         self.decode_errors = 0
+        self.duplicate_count = 0
+
+        # Duplicate detection: fixed-size bitset indexed by sequence
+        # number modulo the window. Constant memory (1 MiB = 8M seqs)
+        # and L1-resident lookups, unlike an ever-growing set of every
+        # sequence seen. Each arrival also clears the slot half a
+        # window ahead of its own, evicting the previous lap's bit
+        # before the sequence space wraps around to it — without that,
+        # every seq past the first 2^23 would alias an already-set bit
+        # and be dropped as a duplicate. A duplicate older than half
+        # the window goes undetected, far beyond any realistic UDP
+        # re-delivery horizon.
+        self._seen_bits = bytearray(1 << 20)
+        self._seen_window = len(self._seen_bits) << 3
+        self._seen_mask = self._seen_window - 1
         
         # Metrics tracking
         self.metrics_collector = MetricsCollector(window_size=1000)
         self.perf_monitor = PerformanceMonitor(update_interval=5.0)
         
+        # Producer/consumer split: run() only drains the kernel socket
+        # buffer and timestamps datagrams; FEC/decrypt/metrics run on a
+        # worker thread so the socket is never idle during per-packet
+        # processing (which is where UDP drops come from at high rates).
+        self._work_q = queue.SimpleQueue()
+        self._worker = threading.Thread(
+            target=self._process_queue, daemon=True
+        )
+
+        # Recycled datagram buffers: acquired by the receive loop,
+        # released by the worker after decoding, so steady-state
+        # receive does no per-packet allocations.
+        self._buf_pool = PacketBufferPool()
+
         # Setup socket
         self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
         self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        # Large kernel receive buffer absorbs bursts while the worker
+        # catches up, instead of dropping at the default ~200 KiB.
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 8 << 20)
         
         try:
             self.sock.bind((listen_ip, listen_port))
@@ -80,76 +118,98 @@ class SimURFReceiver:
             logger.error(f"✗ Could not bind socket: {e}")
             raise
     
-    def process_packet(self, data: bytes, addr: tuple) -> bool:
+    def process_packet(self, data: bytes, addr: tuple,
+                       receive_time: Optional[int] = None) -> bool:
         """
         Process received packet.
         
         Args:
             data: Raw packet bytes
             addr: Source address tuple
+            receive_time: Receive timestamp in ns (defaults to now)
             
         Returns:
             True if successfully decoded, False otherwise
         """
         self.packet_count += 1
-        receive_time = time.time_ns()
-        
-        logger.info(f"\n{'─' * 70}")
-        logger.info(f"Packet #{self.packet_count} from {addr}")
-        logger.info(f"Raw size: {len(data)} bytes")
-        
+        if receive_time is None:
+            receive_time = time.time_ns()
+
+        verbose = logger.isEnabledFor(logging.DEBUG)
+        if verbose:
+            logger.debug(f"\n{'─' * 70}")
+            logger.debug(f"Packet #{self.packet_count} from {addr}")
+            logger.debug(f"Raw size: {len(data)} bytes")
+
         try:
             # Step 1: Unpack and validate CRC
             pkt = unpack(data)
-            logger.info(f"✓ CRC valid, SEQ={pkt['seq']}")
-            logger.info(f"  Route: {pkt['src_ip']} → {pkt['dst_ip']}")
-            logger.info(f"  Payload: {len(pkt['payload'])} bytes")
-            
+            logger.debug(f"✓ CRC valid, SEQ={pkt['seq']}")
+
+            byte_idx, bit = divmod(pkt['seq'] & self._seen_mask, 8)
+            if self._seen_bits[byte_idx] & (1 << bit):
+                self.duplicate_count += 1
+                logger.warning(f"✗ Duplicate SEQ={pkt['seq']}, dropping")
+                return False
+            self._seen_bits[byte_idx] |= 1 << bit
+            # Evict the slot half a window ahead so the bitset never
+            # fills up as the sequence space wraps
+            ahead_idx, ahead_bit = divmod(
+                (pkt['seq'] + (self._seen_window >> 1)) & self._seen_mask, 8
+            )
+            self._seen_bits[ahead_idx] &= ~(1 << ahead_bit)
+            if verbose:
+                logger.debug(f"  Route: {pkt['src_ip']} → {pkt['dst_ip']}")
+                logger.debug(f"  Payload: {len(pkt['payload'])} bytes")
+
             payload = pkt["payload"]
             fec_corrections = 0
-            
+
             # Step 2: Optional FEC decoding
             if self.use_fec:
-                logger.info(f"→ Decoding FEC...")
                 payload, fec_corrections = fec_decode_with_stats(
                     payload, 
                     repeat=self.fec_repetition
                 )
-                logger.info(f"✓ FEC decoded: {len(payload)} bytes "
+                logger.debug(f"✓ FEC decoded: {len(payload)} bytes "
                           f"({fec_corrections} corrections)")
             
             # Step 3: Decrypt
-            logger.info(f"→ Decrypting...")
             plaintext = decrypt(payload)
-            logger.info(f"✓ Decrypted: {len(plaintext)} bytes")
-            
-            # Step 4: Decode message
-            message = plaintext.decode(errors='replace')
-            logger.info(f"✓ MESSAGE: '{message}'")
+            logger.debug(f"✓ Decrypted: {len(plaintext)} bytes")
+
+            # Step 4: Decode the message text only when the trace is on;
+            # the decoded string is otherwise unused.
+            if verbose:
+                message = plaintext.decode(errors='replace')
+                logger.debug(f"✓ MESSAGE: '{message}'")
             
             # Calculate latency
             latency_ns = receive_time - pkt['timestamp_ns']
             latency_ms = latency_ns / 1_000_000
             
-            # Record metrics
-            metrics = PacketMetrics(
+            # Record metrics straight into the collector's columns
+            # (no per-packet PacketMetrics object)
+            self.metrics_collector.add(
                 seq=pkt['seq'],
                 timestamp_ns=pkt['timestamp_ns'],
                 size_bytes=len(data),
                 latency_ms=latency_ms,
                 fec_corrections=fec_corrections if self.use_fec else None
             )
-            self.metrics_collector.add_packet(metrics)
             
             # Performance monitoring
+            self.success_count += 1
+
+            # Aggregate report on the monitor's cadence (default 5 s),
+            # the only INFO-level output on the per-packet path.
             stats = self.perf_monitor.update(len(data))
             if stats:
                 logger.info(f"Performance: {stats['pps']:.1f} pps, "
-                          f"{stats['kbps']:.1f} kbps")
-            
-            self.success_count += 1
-            logger.info(f"Stats: {self.success_count} OK | "
-                       f"{self.crc_errors} CRC | {self.decode_errors} Decode")
+                          f"{stats['kbps']:.1f} kbps | "
+                          f"{self.success_count} OK | "
+                          f"{self.crc_errors} CRC | "
+                          f"{self.decode_errors} Decode")
             
             return True
             
@@ -167,16 +227,28 @@ class SimURFReceiver:
     
     def run(self):
         """Main receive loop."""
-        buffer_size = 65535
-        
+        # recvmmsg pulls a burst of queued datagrams per syscall
+        # instead of one recvfrom each; falls back transparently where
+        # libc batching is unavailable.
+        receiver = BatchReceiver(
+            self.sock, batch_size=64, pool=self._buf_pool
+        )
+        if recvmmsg_available():
+            logger.info("Batched receive: recvmmsg x64")
+
+        self._worker.start()
+
         try:
             while True:
-                data, addr = self.sock.recvfrom(buffer_size)
-                self.process_packet(data, addr)
+                for data, addr in receiver.recv_batch():
+                    # Timestamp at receipt; decoding happens later on
+                    # the worker, so latency is not inflated by queueing
+                    self._work_q.put((data, addr, time.time_ns()))
                 
         except KeyboardInterrupt:
             logger.info("\n" + "=" * 70)
             logger.info("Shutting down...")
+            self._drain_worker()
             self._print_summary()
             
         except Exception as e:
@@ -185,6 +257,26 @@ class SimURFReceiver:
         finally:
             self.close()
     
+    def _process_queue(self):
+        """Worker loop: decode queued datagrams until the sentinel."""
+        while True:
+            item = self._work_q.get()
+            if item is None:
+                break
+            data, addr, receive_time = item
+            try:
+                self.process_packet(data, addr, receive_time)
+            except Exception as e:
+                logger.error(f"✗ Worker error: {e}", exc_info=True)
+            finally:
+                if isinstance(data, memoryview):
+                    self._buf_pool.release(data)
+
+    def _drain_worker(self):
+        """Let the worker finish queued packets before the summary."""
+        self._work_q.put(None)
+        self._worker.join(timeout=5.0)
+
     def _print_summary(self):
         """Print final statistics."""
         logger.info("=" * 70)
@@ -194,6 +286,7 @@ class SimURFReceiver:
         logger.info(f"Successful:       {self.success_count}")
         logger.info(f"CRC errors:       {self.crc_errors}")
         logger.info(f"Decode errors:    {self.decode_errors}")
+        logger.info(f"Duplicates:       {self.duplicate_count}")
         
         if self.packet_count > 0:
             success_rate = (self.success_count / self.packet_count) * 100
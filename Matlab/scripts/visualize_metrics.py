@@ -4,11 +4,24 @@ SimURF Metrics Visualization
 Generate plots from collected metrics data.
 """
 import json
+import array
 import argparse
+import matplotlib
+# Select the rasterizing backend before pyplot loads: these plots only
+# go to PNG files and Agg avoids any display/backend probing on headless
+# machines.
+matplotlib.use('Agg')
 import matplotlib.pyplot as plt
 import numpy as np
 from pathlib import Path
 
+# ijson stream-parses the metrics array in bounded memory instead of
+# materializing every per-packet dict up front; optional, large files only
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 
 def load_metrics(filename):
     """Load metrics from JSON file."""
@@ -16,154 +29,209 @@ def load_metrics(filename):
         return json.load(f)
 
 
-def plot_ber(metrics_list, output_dir):
+def stream_metrics(filename, fields=('ber', 'snr_db', 'bit_errors')):
+    """
+    Stream-parse a metrics JSON file without materializing the list.
+
+    Walks the ijson event stream once: top-level scalars (packet_count,
+    runtime_s, ...) are collected into a small dict, and each entry of
+    the metrics array is reduced straight to its numeric fields in
+    growable float buffers — no intermediate list of N dicts.
+
+    Args:
+        filename: Path to metrics JSON file
+        fields: Numeric field names to extract per metrics entry
+
+    Returns:
+        Tuple of (top-level scalars dict, field-name -> float64 ndarray)
+    """
+    buffers = {field: array.array('d') for field in fields}
+    scalars = {}
+    entry = None
+
+    with open(filename, 'rb') as f:
+        for prefix, event, value in ijson.parse(f):
+            if prefix == 'metrics.item':
+                if event == 'start_map':
+                    entry = {}
+                elif event == 'end_map':
+                    for field in fields:
+                        v = entry.get(field)
+                        buffers[field].append(
+                            float('nan') if v is None else v
+                        )
+                    entry = None
+            elif entry is not None and event == 'number':
+                entry[prefix.rsplit('.', 1)[1]] = float(value)
+            elif event == 'number' and '.' not in prefix:
+                scalars[prefix] = float(value)
+
+    arrays = {
+        field: np.frombuffer(buf, dtype=np.float64).copy() if len(buf)
+        else np.empty(0, dtype=np.float64)
+        for field, buf in buffers.items()
+    }
+    return scalars, arrays
+
+
+def extract_arrays(metrics_list, fields=('ber', 'snr_db', 'bit_errors')):
+    """
+    Extract numeric fields from the metrics list into NumPy arrays.
+
+    np.fromiter fills a pre-sized float64 array per field directly,
+    instead of each plot function re-walking the whole list with its
+    own comprehension. Missing fields are stored as NaN so downstream
+    masks and nan-aware reductions skip them.
+
+    Args:
+        metrics_list: List of per-packet metric dicts
+        fields: Field names to extract
+
+    Returns:
+        Dict mapping field name to a float64 ndarray (NaN = missing)
+    """
+    n = len(metrics_list)
+    return {
+        field: np.fromiter(
+            (m.get(field, np.nan) for m in metrics_list),
+            dtype=np.float64,
+            count=n
+        )
+        for field in fields
+    }
+
+
+def plot_ber(fig, ax, arrays, output_dir):
     """Plot Bit Error Rate over time."""
-    bers = []
-    packet_nums = []
-    
-    for i, m in enumerate(metrics_list):
-        if 'ber' in m:
-            bers.append(m['ber'])
-            packet_nums.append(i)
-    
-    if not bers:
+    ber = arrays['ber']
+    valid = ~np.isnan(ber)
+
+    if not valid.any():
         print("No BER data available")
         return
-    
-    plt.figure(figsize=(12, 6))
-    plt.semilogy(packet_nums, bers, marker='o', linestyle='-', alpha=0.7)
-    plt.xlabel('Packet Number', fontsize=12)
-    plt.ylabel('Bit Error Rate (BER)', fontsize=12)
-    plt.title('Bit Error Rate Over Time', fontsize=14, fontweight='bold')
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    
+
+    ax.cla()
+    ax.semilogy(np.nonzero(valid)[0], ber[valid],
+                marker='o', linestyle='-', alpha=0.7)
+    ax.set_xlabel('Packet Number', fontsize=12)
+    ax.set_ylabel('Bit Error Rate (BER)', fontsize=12)
+    ax.set_title('Bit Error Rate Over Time', fontsize=14, fontweight='bold')
+    ax.grid(True, alpha=0.3)
+    fig.tight_layout()
+
     output_file = Path(output_dir) / 'ber_plot.png'
-    plt.savefig(output_file, dpi=300)
+    fig.savefig(output_file, dpi=300)
     print(f"Saved BER plot to {output_file}")
-    plt.close()
 
 
-def plot_snr(metrics_list, output_dir):
+def plot_snr(fig, ax, arrays, output_dir):
     """Plot SNR over time."""
-    snrs = []
-    packet_nums = []
-    
-    for i, m in enumerate(metrics_list):
-        if 'snr_db' in m:
-            snrs.append(m['snr_db'])
-            packet_nums.append(i)
-    
-    if not snrs:
+    snr = arrays['snr_db']
+    valid = ~np.isnan(snr)
+
+    if not valid.any():
         print("No SNR data available")
         return
-    
-    plt.figure(figsize=(12, 6))
-    plt.plot(packet_nums, snrs, marker='o', linestyle='-', alpha=0.7, color='green')
-    plt.xlabel('Packet Number', fontsize=12)
-    plt.ylabel('SNR (dB)', fontsize=12)
-    plt.title('Signal-to-Noise Ratio Over Time', fontsize=14, fontweight='bold')
-    plt.grid(True, alpha=0.3)
-    plt.tight_layout()
-    
+
+    ax.cla()
+    ax.plot(np.nonzero(valid)[0], snr[valid],
+            marker='o', linestyle='-', alpha=0.7, color='green')
+    ax.set_xlabel('Packet Number', fontsize=12)
+    ax.set_ylabel('SNR (dB)', fontsize=12)
+    ax.set_title('Signal-to-Noise Ratio Over Time', fontsize=14, fontweight='bold')
+    ax.grid(True, alpha=0.3)
+    fig.tight_layout()
+
     output_file = Path(output_dir) / 'snr_plot.png'
-    plt.savefig(output_file, dpi=300)
+    fig.savefig(output_file, dpi=300)
     print(f"Saved SNR plot to {output_file}")
-    plt.close()
 
 
-def plot_error_distribution(metrics_list, output_dir):
+def plot_error_distribution(fig, ax, arrays, output_dir):
     """Plot distribution of bit errors."""
-    bit_errors = []
-    
-    for m in metrics_list:
-        if 'bit_errors' in m:
-            bit_errors.append(m['bit_errors'])
-    
-    if not bit_errors:
+    bit_errors = arrays['bit_errors']
+    bit_errors = bit_errors[~np.isnan(bit_errors)]
+
+    if bit_errors.size == 0:
         print("No bit error data available")
         return
-    
-    plt.figure(figsize=(10, 6))
-    plt.hist(bit_errors, bins=30, edgecolor='black', alpha=0.7)
-    plt.xlabel('Bit Errors per Packet', fontsize=12)
-    plt.ylabel('Frequency', fontsize=12)
-    plt.title('Distribution of Bit Errors', fontsize=14, fontweight='bold')
-    plt.grid(True, alpha=0.3, axis='y')
-    plt.tight_layout()
-    
+
+    ax.cla()
+    ax.hist(bit_errors, bins=30, edgecolor='black', alpha=0.7)
+    ax.set_xlabel('Bit Errors per Packet', fontsize=12)
+    ax.set_ylabel('Frequency', fontsize=12)
+    ax.set_title('Distribution of Bit Errors', fontsize=14, fontweight='bold')
+    ax.grid(True, alpha=0.3, axis='y')
+    fig.tight_layout()
+
     output_file = Path(output_dir) / 'error_distribution.png'
-    plt.savefig(output_file, dpi=300)
+    fig.savefig(output_file, dpi=300)
     print(f"Saved error distribution to {output_file}")
-    plt.close()
 
 
-def plot_summary_stats(data, output_dir):
+def plot_summary_stats(data, arrays, output_dir):
     """Plot summary statistics."""
     fig, axes = plt.subplots(2, 2, figsize=(14, 10))
-    
-    metrics_list = data.get('metrics', [])
-    
-    # Extract data
-    bers = [m.get('ber', 0) for m in metrics_list if 'ber' in m]
-    snrs = [m.get('snr_db', 0) for m in metrics_list if 'snr_db' in m]
-    bit_errors = [m.get('bit_errors', 0) for m in metrics_list if 'bit_errors' in m]
-    
+
+    bers = arrays['ber'][~np.isnan(arrays['ber'])]
+    snrs = arrays['snr_db'][~np.isnan(arrays['snr_db'])]
+    bit_errors = arrays['bit_errors'][~np.isnan(arrays['bit_errors'])]
+
     # BER over time
-    if bers:
-        axes[0, 0].semilogy(range(len(bers)), bers, 'b-', alpha=0.7)
+    if bers.size:
+        axes[0, 0].semilogy(np.arange(bers.size), bers, 'b-', alpha=0.7)
         axes[0, 0].set_xlabel('Packet Number')
         axes[0, 0].set_ylabel('BER')
         axes[0, 0].set_title('BER Over Time')
         axes[0, 0].grid(True, alpha=0.3)
-    
+
     # SNR over time
-    if snrs:
-        axes[0, 1].plot(range(len(snrs)), snrs, 'g-', alpha=0.7)
+    if snrs.size:
+        axes[0, 1].plot(np.arange(snrs.size), snrs, 'g-', alpha=0.7)
         axes[0, 1].set_xlabel('Packet Number')
         axes[0, 1].set_ylabel('SNR (dB)')
         axes[0, 1].set_title('SNR Over Time')
         axes[0, 1].grid(True, alpha=0.3)
-    
+
     # BER histogram
-    if bers:
+    if bers.size:
         axes[1, 0].hist(bers, bins=20, edgecolor='black', alpha=0.7)
         axes[1, 0].set_xlabel('BER')
         axes[1, 0].set_ylabel('Frequency')
         axes[1, 0].set_title('BER Distribution')
         axes[1, 0].grid(True, alpha=0.3, axis='y')
-    
+
     # Statistics text
-    mean_ber = np.mean(bers) if bers else 0
-    median_ber = np.median(bers) if bers else 0
-    max_ber = max(bers) if bers else 0
-    total_bit_errors = sum(bit_errors) if bit_errors else 0
-    pkts_with_errors = sum(1 for e in bit_errors if e > 0) if bit_errors else 0
-    
+    mean_ber = np.mean(bers) if bers.size else 0
+    median_ber = np.median(bers) if bers.size else 0
+    max_ber = np.max(bers) if bers.size else 0
+    total_bit_errors = int(np.sum(bit_errors)) if bit_errors.size else 0
+    pkts_with_errors = int(np.count_nonzero(bit_errors > 0))
+
     stats_text = f"""
     Total Packets: {data.get('packet_count', 0)}
     Runtime: {data.get('runtime_s', 0):.2f} s
-    
+
     BER Statistics:
     - Mean: {mean_ber:.6f}
     - Median: {median_ber:.6f}
     - Max: {max_ber:.6f}
-    
+
     Error Statistics:
     - Total bit errors: {total_bit_errors}
     - Packets with errors: {pkts_with_errors}
     """
-    
+
     axes[1, 1].text(0.1, 0.5, stats_text, fontsize=10, family='monospace',
                    verticalalignment='center', transform=axes[1, 1].transAxes)
     axes[1, 1].axis('off')
-    
+
     plt.tight_layout()
-    
+
     output_file = Path(output_dir) / 'summary_dashboard.png'
-    plt.savefig(output_file, dpi=300)
+    fig.savefig(output_file, dpi=300)
     print(f"Saved summary dashboard to {output_file}")
-    plt.close()
+    plt.close(fig)
 
 
 def main():
@@ -180,29 +248,38 @@ def main():
         default='./plots',
         help='Output directory for plots'
     )
-    
+
     args = parser.parse_args()
-    
+
     # Create output directory
     output_dir = Path(args.output_dir)
     output_dir.mkdir(parents=True, exist_ok=True)
-    
-    # Load metrics
+
+    # Load metrics: streamed when ijson is installed, otherwise one
+    # json.load plus a single extraction pass shared by every plot
     print(f"Loading metrics from {args.metrics_file}...")
-    data = load_metrics(args.metrics_file)
-    
-    metrics_list = data.get('metrics', [])
-    print(f"Found {len(metrics_list)} packet metrics")
-    
-    # Generate plots
+    if ijson is not None:
+        data, arrays = stream_metrics(args.metrics_file)
+        n_metrics = next(iter(arrays.values())).size
+    else:
+        data = load_metrics(args.metrics_file)
+        metrics_list = data.get('metrics', [])
+        arrays = extract_arrays(metrics_list)
+        n_metrics = len(metrics_list)
+    print(f"Found {n_metrics} packet metrics")
+
+    # Generate plots, reusing one figure/canvas for the single-axes
+    # plots instead of building and tearing one down per plot
     print("\nGenerating plots...")
-    plot_ber(metrics_list, output_dir)
-    plot_snr(metrics_list, output_dir)
-    plot_error_distribution(metrics_list, output_dir)
-    plot_summary_stats(data, output_dir)
-    
+    fig, ax = plt.subplots(figsize=(12, 6))
+    plot_ber(fig, ax, arrays, output_dir)
+    plot_snr(fig, ax, arrays, output_dir)
+    plot_error_distribution(fig, ax, arrays, output_dir)
+    plt.close(fig)
+    plot_summary_stats(data, arrays, output_dir)
+
     print(f"\n✅ All plots saved to {output_dir}")
 
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
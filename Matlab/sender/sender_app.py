@@ -14,6 +14,7 @@ from shared.crypto_utils import encrypt
 from shared.fec_utils import fec_encode
 from shared.config_utils import SimURFConfig, ConfigurationError
 from shared.metrics import PerformanceMonitor
+from shared.net_utils import BatchSender, sendmmsg_available
 
 # Configure logging
 logging.basicConfig(
@@ -56,6 +57,13 @@ class SimURFSender:
         
         self.seq = 0
         self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        # Larger send buffer absorbs bursts from the batched path
+        self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, 4 << 20)
+        # The destination is fixed, so connect once and use send():
+        # the kernel skips the per-call sockaddr copy/validation and
+        # Python skips rebuilding the address tuple per packet.
+        self.sock.connect((simulator_host, simulator_port))
+        self.batch_sender = BatchSender(self.sock, batch_size=64)
         self.perf_monitor = PerformanceMonitor(update_interval=5.0)
         
         logger.info("=" * 70)
@@ -66,48 +74,58 @@ class SimURFSender:
         logger.info(f"Route: {src_ip} → {dst_ip}")
         logger.info("=" * 70)
     
+    def _build_packet(self, message: str) -> bytes:
+        """
+        Encrypt, FEC-encode and pack one message into packet bytes.
+
+        Args:
+            message: Text message to encode
+
+        Returns:
+            Wire-ready packet bytes (consumes one sequence number)
+        """
+        # Step 1: Encrypt
+        ciphertext = encrypt(message.encode())
+
+        # Step 2: Optional FEC
+        if self.use_fec:
+            payload = fec_encode(ciphertext, repeat=self.fec_repetition)
+        else:
+            payload = ciphertext
+
+        # Step 3: Pack packet
+        packet_bytes = pack(
+            seq=self.seq,
+            src_ip=self.src_ip,
+            dst_ip=self.dst_ip,
+            timestamp_ns=time.time_ns(),
+            payload=payload
+        )
+        self.seq += 1
+        return packet_bytes
+
     def send_message(self, message: str, delay_after: float = 0.0) -> bool:
         """
         Send a single message.
-        
+
         Args:
             message: Text message to send
             delay_after: Delay in seconds after sending
-            
+
         Returns:
             True if successful, False otherwise
         """
         try:
-            timestamp_ns = time.time_ns()
-            
             logger.info(f"\n{'─' * 70}")
             logger.info(f"Packet #{self.seq}")
             logger.info(f"Message: '{message}' ({len(message)} chars)")
-            
-            # Step 1: Encrypt
-            ciphertext = encrypt(message.encode())
-            logger.info(f"→ Encrypted: {len(ciphertext)} bytes")
-            
-            # Step 2: Optional FEC
-            if self.use_fec:
-                payload = fec_encode(ciphertext, repeat=self.fec_repetition)
-                logger.info(f"→ FEC encoded: {len(payload)} bytes ({self.fec_repetition}x)")
-            else:
-                payload = ciphertext
-                logger.info(f"→ No FEC")
-            
-            # Step 3: Pack packet
-            packet_bytes = pack(
-                seq=self.seq,
-                src_ip=self.src_ip,
-                dst_ip=self.dst_ip,
-                timestamp_ns=timestamp_ns,
-                payload=payload
-            )
-            logger.info(f"→ Packed: {len(packet_bytes)} bytes total")
-            
-            # Step 4: Send to simulator
-            self.sock.sendto(packet_bytes, (self.simulator_host, self.simulator_port))
+
+            packet_bytes = self._build_packet(message)
+            logger.info(f"→ Packed: {len(packet_bytes)} bytes total "
+                       f"(FEC {'on' if self.use_fec else 'off'})")
+
+            # Send to simulator (socket is connected in __init__)
+            self.sock.send(packet_bytes)
             logger.info(f"✓ Sent to {self.simulator_host}:{self.simulator_port}")
             
             # Update performance metrics
@@ -115,9 +133,7 @@ class SimURFSender:
             if stats:
                 logger.info(f"Performance: {stats['pps']:.1f} pps, "
                           f"{stats['kbps']:.1f} kbps")
-            
-            self.seq += 1
-            
+
             if delay_after > 0:
                 time.sleep(delay_after)
             
@@ -138,12 +154,35 @@ class SimURFSender:
         logger.info(f"\n{'═' * 70}")
         logger.info(f"Starting batch: {len(messages)} messages")
         logger.info(f"{'═' * 70}")
-        
+
         success = 0
-        for msg in messages:
-            if self.send_message(msg, delay):
-                success += 1
-        
+        if delay <= 0 and sendmmsg_available():
+            # No inter-packet pacing requested: build every packet up
+            # front and dispatch them with sendmmsg, one syscall per 64
+            # datagrams instead of one sendto each.
+            try:
+                packets = [self._build_packet(msg) for msg in messages]
+                success = self.batch_sender.send_batch(packets)
+                for pkt in packets:
+                    self.perf_monitor.update(len(pkt))
+                logger.info(f"✓ Sent {success} packets via sendmmsg")
+            except Exception as e:
+                logger.error(f"✗ Batched send failed: {e}")
+        else:
+            # Deadline-based pacing: each send is scheduled at
+            # start + k*interval and only the remainder is slept, so
+            # time spent encrypting/packing does not accumulate as
+            # drift below the requested rate (as sleep-after-send did).
+            interval_ns = int(delay * 1e9)
+            next_tx = time.monotonic_ns()
+            for msg in messages:
+                if self.send_message(msg):
+                    success += 1
+                next_tx += interval_ns
+                remaining_ns = next_tx - time.monotonic_ns()
+                if remaining_ns > 0:
+                    time.sleep(remaining_ns / 1e9)
+
         logger.info(f"\n{'═' * 70}")
         logger.info(f"Batch complete: {success}/{len(messages)} sent successfully")
         logger.info(f"{'═' * 70}")
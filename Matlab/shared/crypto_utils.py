@@ -3,11 +3,96 @@ Simple XOR-based encryption for demonstration purposes.
 """
 import os
 import hashlib
+import threading
 from typing import Optional
 
+import numpy as np
+
+# Optional AES-128-CTR via the cryptography package: OpenSSL dispatches
+# to AES-NI on x86_64, and CTR is a proper stream cipher rather than the
+# demonstration repeating-key XOR.
+try:
+    from cryptography.hazmat.primitives.ciphers import (
+        Cipher, algorithms, modes
+    )
+    CRYPTOGRAPHY_AVAILABLE = True
+except ImportError:
+    CRYPTOGRAPHY_AVAILABLE = False
+
+# The cipher changes the wire format (16-byte vs 4-byte nonce), so it
+# must be selected explicitly and identically on both peers via
+# SIMURF_CIPHER — never inferred from which packages happen to be
+# importable, which would let mismatched hosts "decrypt" each other's
+# traffic into garbage that still passes the CRC.
+_CIPHER = os.environ.get("SIMURF_CIPHER", "xor").strip().lower()
+if _CIPHER not in ("xor", "aes"):
+    raise ValueError(
+        f"SIMURF_CIPHER must be 'xor' or 'aes', got {_CIPHER!r}"
+    )
+if _CIPHER == "aes" and not CRYPTOGRAPHY_AVAILABLE:
+    raise ImportError(
+        "SIMURF_CIPHER=aes requires the cryptography package"
+    )
+AES_ENABLED = _CIPHER == "aes"
+
+# Optional numba kernel: LLVM fuses the keystream tiling and XOR into
+# one vectorized loop with no intermediate array; the eager signature
+# compiles at import instead of on the first packet.
+try:
+    from numba import njit, types
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    # np.frombuffer over bytes yields read-only arrays, so the eager
+    # signature must declare readonly inputs or every call raises
+    _u8_ro = types.Array(types.uint8, 1, 'C', readonly=True)
+
+    @njit(types.Array(types.uint8, 1, 'C')(_u8_ro, _u8_ro), cache=True)
+    def _xor_kernel(data, keystream):
+        out = np.empty(data.size, dtype=np.uint8)
+        klen = keystream.size
+        for i in range(data.size):
+            out[i] = data[i] ^ keystream[i % klen]
+        return out
+
 # Default demonstration key
 DEFAULT_KEY = b"simurf-secret-key-v1"
 
+# Below this size the NumPy call overhead exceeds the Python loop cost
+_XOR_VECTOR_MIN = 64
+
+
+class _NonceRing:
+    """
+    Prefilled entropy pool for per-packet nonces.
+
+    os.urandom is a getrandom() syscall per call; drawing one 4 KiB
+    block and slicing nonces from it amortizes that syscall over ~1000
+    packets. The pool refills with fresh entropy on wrap, so nonces are
+    never reused. Thread-safe: encrypt runs on bridge worker threads.
+    """
+
+    def __init__(self, size: int = 4096):
+        self._size = size
+        self._buf = os.urandom(size)
+        self._pos = 0
+        self._lock = threading.Lock()
+
+    def take(self, n: int) -> bytes:
+        """Return n fresh random bytes from the pool."""
+        with self._lock:
+            if self._pos + n > self._size:
+                self._buf = os.urandom(self._size)
+                self._pos = 0
+            nonce = self._buf[self._pos:self._pos + n]
+            self._pos += n
+        return nonce
+
+
+_nonce_ring = _NonceRing()
+
 
 class CryptoManager:
     """Manages encryption/decryption with configurable keys."""
@@ -22,10 +107,28 @@ class CryptoManager:
         self.key = key or DEFAULT_KEY
         if len(self.key) < 8:
             raise ValueError("Key too short (minimum 8 bytes)")
+        if AES_ENABLED:
+            # Derive a fixed 16-byte AES key so shorter (>=8 byte)
+            # legacy keys keep working
+            self._aes_key = hashlib.sha256(self.key).digest()[:16]
     
     def _xor(self, data: bytes, keystream: bytes) -> bytes:
-        """XOR data with keystream."""
-        return bytes(b ^ keystream[i % len(keystream)] for i, b in enumerate(data))
+        """XOR data with repeating keystream."""
+        if len(data) < _XOR_VECTOR_MIN:
+            return bytes(
+                b ^ keystream[i % len(keystream)] for i, b in enumerate(data)
+            )
+        if NUMBA_AVAILABLE:
+            return _xor_kernel(
+                np.frombuffer(data, dtype=np.uint8),
+                np.frombuffer(keystream, dtype=np.uint8)
+            ).tobytes()
+        # Tile the keystream to the payload length and XOR in one
+        # vectorized uint8 pass instead of a Python loop per byte
+        ks = np.resize(np.frombuffer(keystream, dtype=np.uint8), len(data))
+        return np.bitwise_xor(
+            np.frombuffer(data, dtype=np.uint8), ks
+        ).tobytes()
     
     def encrypt(self, plaintext: bytes) -> bytes:
         """
@@ -41,14 +144,18 @@ class CryptoManager:
         """
         if not plaintext:
             raise ValueError("Cannot encrypt empty data")
-            
-        # Generate random nonce
-        nonce = os.urandom(4)
-        
-        # Create keystream from nonce + key
+
+        if AES_ENABLED:
+            # AES-128-CTR: [16-byte nonce][ciphertext]
+            nonce = _nonce_ring.take(16)
+            encryptor = Cipher(
+                algorithms.AES(self._aes_key), modes.CTR(nonce)
+            ).encryptor()
+            return nonce + encryptor.update(plaintext) + encryptor.finalize()
+
+        # XOR fallback: [4-byte nonce][ciphertext]
+        nonce = _nonce_ring.take(4)
         keystream = nonce + self.key
-        
-        # Encrypt
         ciphertext = self._xor(plaintext, keystream)
         
         return nonce + ciphertext
@@ -68,9 +175,20 @@ class CryptoManager:
         """
         if len(data) < 5:  # At least 4-byte nonce + 1 byte data
             raise ValueError(f"Data too short for decryption: {len(data)} bytes")
-        
-        # Extract nonce
-        nonce = data[:4]
+
+        if AES_ENABLED:
+            if len(data) < 17:  # 16-byte nonce + at least 1 byte data
+                raise ValueError(
+                    f"Data too short for decryption: {len(data)} bytes"
+                )
+            nonce = bytes(data[:16])
+            decryptor = Cipher(
+                algorithms.AES(self._aes_key), modes.CTR(nonce)
+            ).decryptor()
+            return decryptor.update(data[16:]) + decryptor.finalize()
+
+        # Extract nonce (bytes() also normalizes memoryview input)
+        nonce = bytes(data[:4])
         ciphertext = data[4:]
         
         # Recreate keystream
@@ -5,6 +5,8 @@ Implements simple repetition codes and majority-vote decoding.
 from typing import Tuple
 from collections import Counter
 
+import numpy as np
+
 
 class FECCodec:
     """Forward Error Correction codec using repetition coding."""
@@ -34,8 +36,15 @@ class FECCodec:
         """
         if not data:
             return b""
-        
-        return b"".join(bytes([b]) * self.repetition for b in data)
+
+        if self.repetition == 1:
+            return bytes(data)
+
+        # np.repeat expands the whole buffer in one C-level pass,
+        # versus a 1-byte bytes object allocated per input byte
+        return np.repeat(
+            np.frombuffer(data, dtype=np.uint8), self.repetition
+        ).tobytes()
     
     def decode(self, data: bytes) -> Tuple[bytes, int]:
         """
@@ -57,10 +66,27 @@ class FECCodec:
         
         if not data:
             return b"", 0
-        
+
+        if self.repetition == 3:
+            # Bitwise majority-of-three: each output bit is set iff at
+            # least two copies agree, computed 8 bits per byte across
+            # the whole buffer in a few SIMD passes — no per-chunk
+            # Counter. For triplets where all three copies differ
+            # (beyond the code's design error rate) the per-bit vote
+            # may differ from picking one whole candidate byte.
+            arr = np.frombuffer(data, dtype=np.uint8)
+            a, b, c = arr[0::3], arr[1::3], arr[2::3]
+            majority = (a & b) | (a & c) | (b & c)
+            corrections = int(
+                np.count_nonzero(a != majority)
+                + np.count_nonzero(b != majority)
+                + np.count_nonzero(c != majority)
+            )
+            return majority.tobytes(), corrections
+
         decoded = bytearray()
         corrections = 0
-        
+
         for i in range(0, len(data), self.repetition):
             chunk = data[i:i + self.repetition]
             
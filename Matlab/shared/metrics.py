@@ -5,8 +5,123 @@ import time
 import json
 from typing import Dict, Optional, Any
 from dataclasses import dataclass, asdict
-from collections import deque
-import statistics
+
+import numpy as np
+
+
+# Missing-value sentinel for integer ring columns (NaN fills floats)
+_INT_MISSING = np.iinfo(np.int64).min
+
+
+class MetricsRing:
+    """
+    Columnar (struct-of-arrays) ring buffer for numeric metric fields.
+
+    Keeps one ndarray per field instead of a deque of dicts, so window
+    statistics run as single NumPy reductions over packed values rather
+    than per-element Python attribute lookups. Missing float values are
+    stored as NaN and skipped by the nan-aware reductions; integer
+    columns use an int64 sentinel.
+    """
+
+    def __init__(self, fields, window_size: int = 100):
+        """
+        Initialize ring buffer.
+
+        Args:
+            fields: Iterable of field names (stored as float64), or a
+                dict mapping field name to NumPy dtype
+            window_size: Number of entries to keep in the rolling window
+        """
+        if not isinstance(fields, dict):
+            fields = {name: np.float64 for name in fields}
+        self.window_size = window_size
+        self._columns = {}
+        self._missing = {}
+        for name, dtype in fields.items():
+            dtype = np.dtype(dtype)
+            missing = _INT_MISSING if dtype.kind in 'iu' else np.nan
+            self._columns[name] = np.full(window_size, missing, dtype=dtype)
+            self._missing[name] = missing
+        self._idx = 0
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, **values):
+        """
+        Record one entry; unnamed fields are stored as missing.
+
+        Args:
+            **values: Field values for this entry (None treated as missing)
+        """
+        idx = self._idx
+        for name, column in self._columns.items():
+            value = values.get(name)
+            column[idx] = self._missing[name] if value is None else value
+        self._idx = (idx + 1) % self.window_size
+        self._count = min(self._count + 1, self.window_size)
+
+    def column(self, name: str) -> np.ndarray:
+        """Valid slice of one field's ring (includes NaN gaps)."""
+        return self._columns[name][:self._count]
+
+    def stats(self, name: str) -> Optional[Dict[str, float]]:
+        """
+        Summary statistics for one field over the current window.
+
+        Args:
+            name: Field name
+
+        Returns:
+            Dict with mean/median/min/max/stdev, or None if the field
+            has no recorded values in the window
+        """
+        values = self.column(name)
+        valid = int(np.count_nonzero(~np.isnan(values)))
+        if not valid:
+            return None
+        return {
+            "mean": float(np.nanmean(values)),
+            "median": float(np.nanmedian(values)),
+            "min": float(np.nanmin(values)),
+            "max": float(np.nanmax(values)),
+            "stdev": float(np.nanstd(values, ddof=1)) if valid > 1 else 0.0,
+        }
+
+    def rows(self):
+        """
+        Iterate window entries chronologically as plain dicts.
+
+        Missing values are yielded as None; integer columns come back
+        as Python ints. Intended for export, not the hot path.
+        """
+        if self._count < self.window_size:
+            order = range(self._count)
+        else:
+            order = (
+                (self._idx + i) % self.window_size
+                for i in range(self.window_size)
+            )
+        for i in order:
+            row = {}
+            for name, column in self._columns.items():
+                value = column[i]
+                if value == self._missing[name] or (
+                    isinstance(value, np.floating) and np.isnan(value)
+                ):
+                    row[name] = None
+                else:
+                    row[name] = value.item()
+            yield row
+
+    def clear(self):
+        """Reset the window."""
+        for name, column in self._columns.items():
+            column.fill(self._missing[name])
+        self._idx = 0
+        self._count = 0
 
 
 @dataclass
@@ -26,6 +141,19 @@ class PacketMetrics:
         return asdict(self)
 
 
+# Column dtypes for the collector's rolling window
+_PACKET_FIELDS = {
+    "seq": np.int64,
+    "timestamp_ns": np.int64,
+    "size_bytes": np.int64,
+    "snr_db": np.float64,
+    "ber": np.float64,
+    "bit_errors": np.int64,
+    "latency_ms": np.float64,
+    "fec_corrections": np.int64,
+}
+
+
 class MetricsCollector:
     """Collects and aggregates packet metrics."""
     
@@ -37,11 +165,72 @@ class MetricsCollector:
             window_size: Number of packets to keep in rolling window
         """
         self.window_size = window_size
-        self.packets: deque = deque(maxlen=window_size)
+        # Struct-of-arrays window: add() is a handful of array stores
+        # and get_summary() reduces packed columns, with no per-packet
+        # Python object retained.
+        self.ring = MetricsRing(_PACKET_FIELDS, window_size)
         self.total_packets = 0
         self.total_errors = 0
         self.start_time = time.time()
+
+        # Welford running latency aggregates over the whole run: O(1)
+        # per packet, and unlike the window they are not distorted by
+        # old samples falling out of the deque.
+        self._lat_count = 0
+        self._lat_mean = 0.0
+        self._lat_m2 = 0.0
+        self._lat_min = float("inf")
+        self._lat_max = float("-inf")
     
+    def add(
+        self,
+        seq: int,
+        timestamp_ns: int,
+        size_bytes: int,
+        snr_db: Optional[float] = None,
+        ber: Optional[float] = None,
+        bit_errors: Optional[int] = None,
+        latency_ms: Optional[float] = None,
+        fec_corrections: Optional[int] = None
+    ):
+        """
+        Record one packet's metrics without an intermediate object.
+
+        Args:
+            seq: Sequence number
+            timestamp_ns: Send timestamp in nanoseconds
+            size_bytes: Packet size in bytes
+            snr_db: Signal-to-noise ratio in dB, if known
+            ber: Bit error rate, if known
+            bit_errors: Bit error count, if known
+            latency_ms: End-to-end latency in ms, if known
+            fec_corrections: FEC corrections applied, if known
+        """
+        self.ring.append(
+            seq=seq,
+            timestamp_ns=timestamp_ns,
+            size_bytes=size_bytes,
+            snr_db=snr_db,
+            ber=ber,
+            bit_errors=bit_errors,
+            latency_ms=latency_ms,
+            fec_corrections=fec_corrections
+        )
+        self.total_packets += 1
+
+        if bit_errors and bit_errors > 0:
+            self.total_errors += 1
+
+        if latency_ms is not None:
+            self._lat_count += 1
+            delta = latency_ms - self._lat_mean
+            self._lat_mean += delta / self._lat_count
+            self._lat_m2 += delta * (latency_ms - self._lat_mean)
+            if latency_ms < self._lat_min:
+                self._lat_min = latency_ms
+            if latency_ms > self._lat_max:
+                self._lat_max = latency_ms
+
     def add_packet(self, metrics: PacketMetrics):
         """
         Add packet metrics.
@@ -49,11 +238,16 @@ class MetricsCollector:
         Args:
             metrics: Packet metrics to add
         """
-        self.packets.append(metrics)
-        self.total_packets += 1
-        
-        if metrics.bit_errors and metrics.bit_errors > 0:
-            self.total_errors += 1
+        self.add(
+            metrics.seq,
+            metrics.timestamp_ns,
+            metrics.size_bytes,
+            snr_db=metrics.snr_db,
+            ber=metrics.ber,
+            bit_errors=metrics.bit_errors,
+            latency_ms=metrics.latency_ms,
+            fec_corrections=metrics.fec_corrections
+        )
     
     def get_summary(self) -> Dict[str, Any]:
         """
@@ -62,7 +256,7 @@ class MetricsCollector:
         Returns:
             Dictionary with aggregate metrics
         """
-        if not self.packets:
+        if not len(self.ring):
             return {
                 "total_packets": 0,
                 "window_packets": 0,
@@ -70,44 +264,45 @@ class MetricsCollector:
                 "runtime_s": time.time() - self.start_time
             }
         
-        # Extract values
-        bers = [p.ber for p in self.packets if p.ber is not None]
-        latencies = [p.latency_ms for p in self.packets if p.latency_ms is not None]
-        snrs = [p.snr_db for p in self.packets if p.snr_db is not None]
-        
         summary = {
             "total_packets": self.total_packets,
-            "window_packets": len(self.packets),
+            "window_packets": len(self.ring),
             "error_rate": self.total_errors / self.total_packets if self.total_packets > 0 else 0.0,
             "runtime_s": time.time() - self.start_time,
         }
         
         # BER statistics
-        if bers:
+        ber_stats = self.ring.stats("ber")
+        if ber_stats:
             summary["ber"] = {
-                "mean": statistics.mean(bers),
-                "median": statistics.median(bers),
-                "min": min(bers),
-                "max": max(bers),
+                key: ber_stats[key]
+                for key in ("mean", "median", "min", "max")
             }
         
         # Latency statistics
-        if latencies:
-            summary["latency_ms"] = {
-                "mean": statistics.mean(latencies),
-                "median": statistics.median(latencies),
-                "min": min(latencies),
-                "max": max(latencies),
-                "stdev": statistics.stdev(latencies) if len(latencies) > 1 else 0.0,
-            }
+        lat_stats = self.ring.stats("latency_ms")
+        if lat_stats:
+            summary["latency_ms"] = lat_stats
         
+        # Whole-run latency statistics (Welford, O(1) per packet)
+        if self._lat_count:
+            summary["latency_ms_total"] = {
+                "count": self._lat_count,
+                "mean": self._lat_mean,
+                "min": self._lat_min,
+                "max": self._lat_max,
+                "stdev": (
+                    (self._lat_m2 / (self._lat_count - 1)) ** 0.5
+                    if self._lat_count > 1 else 0.0
+                ),
+            }
+
         # SNR statistics
-        if snrs:
+        snr_stats = self.ring.stats("snr_db")
+        if snr_stats:
             summary["snr_db"] = {
-                "mean": statistics.mean(snrs),
-                "median": statistics.median(snrs),
-                "min": min(snrs),
-                "max": max(snrs),
+                key: snr_stats[key]
+                for key in ("mean", "median", "min", "max")
             }
         
         return summary
@@ -131,18 +326,17 @@ class MetricsCollector:
         """
         import csv
         
-        if not self.packets:
+        if not len(self.ring):
             return
         
-        # Get all field names from first packet
-        fieldnames = list(self.packets[0].to_dict().keys())
+        fieldnames = list(_PACKET_FIELDS)
         
         with open(filename, 'w', newline='') as f:
             writer = csv.DictWriter(f, fieldnames=fieldnames)
             writer.writeheader()
             
-            for pkt in self.packets:
-                writer.writerow(pkt.to_dict())
+            for row in self.ring.rows():
+                writer.writerow(row)
     
     def export_json(self, filename: str):
         """
@@ -158,10 +352,15 @@ class MetricsCollector:
     
     def reset(self):
         """Reset all metrics."""
-        self.packets.clear()
+        self.ring.clear()
         self.total_packets = 0
         self.total_errors = 0
         self.start_time = time.time()
+        self._lat_count = 0
+        self._lat_mean = 0.0
+        self._lat_m2 = 0.0
+        self._lat_min = float("inf")
+        self._lat_max = float("-inf")
 
 
 class PerformanceMonitor:
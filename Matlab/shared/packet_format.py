@@ -10,7 +10,9 @@ from dataclasses import dataclass
 # Network byte order (big endian)
 # Format: seq (4) | src_ip (4) | dst_ip (4) | timestamp (8) | length (2) | crc32 (4)
 HEADER_FORMAT = "!I4s4sQHI"
-HEADER_SIZE = struct.calcsize(HEADER_FORMAT)
+# Compiled once so pack/unpack skip the per-call format lookup
+_HEADER = struct.Struct(HEADER_FORMAT)
+HEADER_SIZE = _HEADER.size
 
 # Constants
 MAX_PAYLOAD_SIZE = 65507  # Max UDP payload (65535 - 8 UDP header - 20 IP header)
@@ -53,13 +55,18 @@ def pack(seq: int, src_ip: str, dst_ip: str, timestamp_ns: int, payload: bytes)
     """
     # Validate inputs
     pkt = Packet(seq, src_ip, dst_ip, timestamp_ns, payload)
-    
+
     payload_len = len(payload)
     crc = zlib.crc32(payload) & 0xFFFFFFFF
 
+    # Build header and payload into one preallocated buffer: pack_into
+    # writes the header in place and the payload is copied once, instead
+    # of allocating a header bytes object and concatenating.
+    buf = bytearray(HEADER_SIZE + payload_len)
     try:
-        header = struct.pack(
-            HEADER_FORMAT,
+        _HEADER.pack_into(
+            buf,
+            0,
             seq,
             socket.inet_aton(src_ip),
             socket.inet_aton(dst_ip),
@@ -70,7 +77,8 @@ def pack(seq: int, src_ip: str, dst_ip: str, timestamp_ns: int, payload: bytes)
     except socket.error as e:
         raise ValueError(f"Invalid IP address: {e}")
 
-    return header + payload
+    buf[HEADER_SIZE:] = payload
+    return bytes(buf)
 
 
 def unpack(data: bytes) -> Dict[str, any]:
@@ -95,9 +103,7 @@ def unpack(data: bytes) -> Dict[str, any]:
         raise ValueError(f"Packet too short: {len(data)} < {HEADER_SIZE}")
 
     try:
-        seq, src, dst, ts, length, recv_crc = struct.unpack(
-            HEADER_FORMAT, data[:HEADER_SIZE]
-        )
+        seq, src, dst, ts, length, recv_crc = _HEADER.unpack_from(data)
     except struct.error as e:
         raise ValueError(f"Header unpack failed: {e}")
 
@@ -0,0 +1,98 @@
+"""
+Pure-Python fallback channel simulator.
+
+Approximates the MATLAB rf_emulator (BPSK over AWGN) for environments
+without a MATLAB installation: derives an approximate bit error rate
+from the configured SNR and injects random bit flips across the whole
+payload in one vectorized pass.
+"""
+import math
+import time
+from typing import Any, Dict, Tuple
+
+import numpy as np
+
+
+class SimpleChannelSimulator:
+    """Byte-level RF channel approximation driven by the channel config."""
+
+    def __init__(self, config: Dict[str, Any]):
+        """
+        Initialize simulator from channel configuration.
+
+        Args:
+            config: Channel configuration dictionary (same schema as
+                matlab_channel_config.json)
+        """
+        # One PCG64 generator for the simulator's lifetime: faster bulk
+        # draws than the legacy np.random singleton, and seedable via
+        # the config for reproducible runs.
+        self._rng = np.random.default_rng(config.get("rng_seed"))
+        self.reconfigure(config)
+
+    def reconfigure(self, config: Dict[str, Any]):
+        """
+        Apply a (new) channel configuration.
+
+        Channel parameters are flattened into typed attributes here so
+        the per-packet path reads unboxed floats off self instead of
+        chasing dict lookups.
+
+        Args:
+            config: Channel configuration dictionary
+        """
+        self.config = config
+        self.snr_db = float(config.get("snr_db", 20.0))
+        self.doppler = float(config.get("doppler_shift", 0.0))
+        self.channel_model = config.get("channel_model", "AWGN")
+        self.ber = self._ber_for_snr(self.snr_db)
+
+    @staticmethod
+    def _ber_for_snr(snr_db: float) -> float:
+        """Theoretical BPSK-over-AWGN bit error rate for a given SNR."""
+        snr_linear = 10.0 ** (snr_db / 10.0)
+        return 0.5 * math.erfc(math.sqrt(snr_linear))
+
+    def simulate(self, payload: bytes) -> Tuple[bytes, Dict[str, Any]]:
+        """
+        Apply the channel to a payload.
+
+        Draws one bit-flip mask for the whole payload instead of looping
+        per byte, so the work happens in NumPy's C loops.
+
+        Args:
+            payload: Transmitted payload bytes
+
+        Returns:
+            (impaired_payload, metrics) tuple; metrics mirror the fields
+            produced by the MATLAB rf_emulator
+        """
+        # At high SNR the theoretical BER underflows to effectively
+        # zero; skip the copy and the RNG draws and pass the payload
+        # through untouched.
+        if self.ber < 1e-12:
+            return payload, self._metrics(0, len(payload))
+
+        arr = np.frombuffer(payload, dtype=np.uint8).copy()
+        n = arr.size
+
+        flips = self._rng.random((n, 8)) < self.ber
+        bit_errors = int(np.count_nonzero(flips))
+
+        if bit_errors:
+            mask = np.packbits(flips, axis=1, bitorder="little").reshape(-1)
+            arr ^= mask
+
+        return arr.tobytes(), self._metrics(bit_errors, n)
+
+    def _metrics(self, bit_errors: int, n: int) -> Dict[str, Any]:
+        """Build the per-packet metrics dict (rf_emulator field schema)."""
+        return {
+            "snr_db": self.snr_db,
+            "doppler": self.doppler,
+            "channel_model": f"{self.channel_model} (python fallback)",
+            "ber": bit_errors / (n * 8) if n else 0.0,
+            "bit_errors": bit_errors,
+            "bytes_total": n,
+            "timestamp": time.time(),
+        }
@@ -2,7 +2,28 @@ import os
 import sys
 import json
 import socket
-import matlab.engine
+import logging
+import queue
+import threading
+
+# Importing matlab.engine costs hundreds of milliseconds; skip it
+# entirely when the Python fallback channel is requested explicitly.
+if os.environ.get("SIMURF_NO_MATLAB"):
+    MATLAB_AVAILABLE = False
+else:
+    try:
+        import matlab.engine
+        MATLAB_AVAILABLE = True
+    except ImportError:
+        MATLAB_AVAILABLE = False
+
+# orjson serializes the per-packet metrics dict straight to bytes,
+# several times faster than stdlib json plus .encode()
+try:
+    from orjson import dumps as _metrics_dumps
+except ImportError:
+    def _metrics_dumps(obj):
+        return json.dumps(obj).encode()
 
 # --------------------------------------------------
 # Path setup
@@ -25,8 +46,23 @@ MATLAB_FUNC_DIR = os.path.join(
     MATLAB_ROOT, "matlab_components"
 )
 
-print(f"[Simulator] Config path: {CONFIG_PATH}")
-print(f"[Simulator] MATLAB components: {MATLAB_FUNC_DIR}")
+# --------------------------------------------------
+# Logging: per-packet detail is DEBUG-only so the hot loop skips the
+# string formatting and stdout write entirely at the default level.
+# Set SIMURF_VERBOSE=1 to restore the packet-by-packet trace.
+# --------------------------------------------------
+logging.basicConfig(
+    level=logging.DEBUG if os.environ.get("SIMURF_VERBOSE") else logging.INFO,
+    format='[%(asctime)s] [Simulator] %(levelname)s: %(message)s',
+    datefmt='%H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+# Emit an INFO progress line every this many packets
+STATS_INTERVAL = 100
+
+logger.info(f"Config path: {CONFIG_PATH}")
+logger.info(f"MATLAB components: {MATLAB_FUNC_DIR}")
 
 # --------------------------------------------------
 # Load channel config
@@ -49,32 +85,59 @@ ANALYZER_METRICS_PORT = 7001
 
 BUFFER_SIZE = 65535
 
-print(f"[Simulator] Receiver target: {RECEIVER_HOST}:{RECEIVER_PORT}")
+logger.info(f"Receiver target: {RECEIVER_HOST}:{RECEIVER_PORT}")
 
 # --------------------------------------------------
-# Start MATLAB engine
+# Start MATLAB engine pool (with Python fallback)
+#
+# Engine calls are synchronous and can take milliseconds each; with
+# SIMURF_ENGINES > 1, each worker thread owns one engine so packets are
+# emulated in parallel while the main thread keeps draining the socket.
 # --------------------------------------------------
-print("[Simulator] Starting MATLAB engine...")
-try:
-    eng = matlab.engine.start_matlab()
-    eng.addpath(MATLAB_FUNC_DIR, nargout=0)
-    eng.init_channel(channel_cfg, nargout=0)
-    print("[Simulator] MATLAB RF channel initialized")
-except Exception as e:
-    print(f"[Simulator] ERROR starting MATLAB: {e}")
-    sys.exit(1)
+NUM_ENGINES = max(1, int(os.environ.get("SIMURF_ENGINES", "1")))
+
+engines = []
+eng = None
+fallback_channel = None
+
+if MATLAB_AVAILABLE:
+    logger.info(f"Starting {NUM_ENGINES} MATLAB engine(s)...")
+    try:
+        for _ in range(NUM_ENGINES):
+            e = matlab.engine.start_matlab()
+            e.addpath(MATLAB_FUNC_DIR, nargout=0)
+            e.init_channel(channel_cfg, nargout=0)
+            engines.append(e)
+        eng = engines[0]
+        logger.info("MATLAB RF channel initialized")
+    except Exception as e:
+        logger.error(f"ERROR starting MATLAB: {e}")
+        for started in engines:
+            started.quit()
+        engines = []
+        eng = None
+
+if eng is None:
+    from channel_sim import SimpleChannelSimulator
+    fallback_channel = SimpleChannelSimulator(channel_cfg)
+    logger.info("MATLAB unavailable, using Python fallback channel "
+                f"(SNR={fallback_channel.snr_db} dB, BER~{fallback_channel.ber:.2e})")
 
 # --------------------------------------------------
 # UDP sockets
 # --------------------------------------------------
 sock_in = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+# A large kernel receive buffer absorbs traffic bursts while a slow
+# channel call (MATLAB especially) holds up the loop, instead of the
+# kernel silently dropping datagrams at the default ~200 KiB.
+sock_in.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 8 << 20)
 sock_in.bind((LISTEN_IP, LISTEN_PORT))
 
 sock_out = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
 sock_metrics = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
 
-print(f"[Simulator] Listening on {LISTEN_IP}:{LISTEN_PORT}")
-print("[Simulator] Ready to process packets...")
+logger.info(f"Listening on {LISTEN_IP}:{LISTEN_PORT}")
+logger.info("Ready to process packets...")
 
 # --------------------------------------------------
 # Helper function to convert MATLAB types to Python
@@ -91,111 +154,150 @@ def matlab_to_python(value):
         return value
 
 # --------------------------------------------------
-# Main loop
+# Per-packet pipeline (runs inline or on engine workers)
 # --------------------------------------------------
-packet_count = 0
+def process_packet(packet_bytes, channel_eng):
+    """Unpack one packet, run the RF channel, re-pack and forward it."""
+    # -----------------------------
+    # Unpack packet (CRC-safe)
+    # -----------------------------
+    try:
+        pkt = unpack(packet_bytes)
+        logger.debug(f"✓ Unpacked: SEQ={pkt['seq']}, payload={len(pkt['payload'])} bytes")
+    except Exception as e:
+        logger.error(f"✗ Unpack failed: {e}")
+        return
 
-while True:
+    # -----------------------------
+    # Apply RF channel to payload only
+    # -----------------------------
     try:
-        packet_bytes, addr = sock_in.recvfrom(BUFFER_SIZE)
-        packet_count += 1
-        print(f"\n[Simulator] ════════════════════════════════════")
-        print(f"[Simulator] Packet #{packet_count}: Received {len(packet_bytes)} bytes from {addr}")
+        if channel_eng is not None:
+            # bytearray feeds matlab.uint8 via the buffer protocol,
+            # avoiding a per-packet list of boxed Python ints
+            tx_payload = matlab.uint8(bytearray(pkt["payload"]))
+            logger.debug("→ Applying RF channel (MATLAB)...")
 
-        # -----------------------------
-        # Unpack packet (CRC-safe)
-        # -----------------------------
-        try:
-            pkt = unpack(packet_bytes)
-            print(f"[Simulator] ✓ Unpacked: SEQ={pkt['seq']}, payload={len(pkt['payload'])} bytes")
-        except Exception as e:
-            print(f"[Simulator] ✗ Unpack failed: {e}")
-            continue
+            rx_payload, metrics = channel_eng.rf_emulator(tx_payload, nargout=2)
+        else:
+            logger.debug("→ Applying RF channel (Python fallback)...")
+            rx_payload, metrics = fallback_channel.simulate(pkt["payload"])
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("✓ RF emulation complete")
+            logger.debug(f"  SNR: {metrics['snr_db']} dB, Doppler: {metrics['doppler']} Hz")
 
-        # -----------------------------
-        # Apply RF channel to payload only
-        # -----------------------------
-        try:
-            tx_payload = matlab.uint8(list(pkt["payload"]))
-            print(f"[Simulator] → Applying RF channel (MATLAB)...")
-            
-            rx_payload, metrics = eng.rf_emulator(tx_payload, nargout=2)
-            
-            print(f"[Simulator] ✓ RF emulation complete")
-            print(f"[Simulator]   SNR: {metrics['snr_db']} dB, Doppler: {metrics['doppler']} Hz")
-            
             # Show BER if available
             if 'ber' in metrics:
-                print(f"[Simulator]   BER: {metrics['ber']:.4f} ({metrics.get('bit_errors', 0)}/{metrics.get('bytes_total', 0)*8} bits)")
-            
-        except Exception as e:
-            print(f"[Simulator] ✗ MATLAB RF emulation failed: {e}")
-            continue
+                logger.debug(f"  BER: {metrics['ber']:.4f} ({metrics.get('bit_errors', 0)}/{metrics.get('bytes_total', 0)*8} bits)")
 
-        # -----------------------------
-        # Re-pack with impaired payload
-        # -----------------------------
-        try:
-            new_packet = pack(
-                pkt["seq"],
-                pkt["src_ip"],
-                pkt["dst_ip"],
-                pkt["timestamp_ns"],
-                bytes(rx_payload)
-            )
-            print(f"[Simulator] ✓ Re-packed: {len(new_packet)} bytes")
-        except Exception as e:
-            print(f"[Simulator] ✗ Re-pack failed: {e}")
-            continue
+    except Exception as e:
+        logger.error(f"✗ MATLAB RF emulation failed: {e}")
+        return
 
-        # -----------------------------
-        # SEND TO RECEIVER
-        # -----------------------------
-        try:
-            sock_out.sendto(new_packet, (RECEIVER_HOST, RECEIVER_PORT))
-            print(f"[Simulator] ✓ Forwarded to receiver at {RECEIVER_HOST}:{RECEIVER_PORT}")
-        except Exception as e:
-            print(f"[Simulator] ✗ Forward to receiver failed: {e}")
+    # -----------------------------
+    # Re-pack with impaired payload
+    # -----------------------------
+    try:
+        new_packet = pack(
+            pkt["seq"],
+            pkt["src_ip"],
+            pkt["dst_ip"],
+            pkt["timestamp_ns"],
+            bytes(rx_payload)
+        )
+        logger.debug(f"✓ Re-packed: {len(new_packet)} bytes")
+    except Exception as e:
+        logger.error(f"✗ Re-pack failed: {e}")
+        return
+
+    # -----------------------------
+    # SEND TO RECEIVER
+    # -----------------------------
+    try:
+        sock_out.sendto(new_packet, (RECEIVER_HOST, RECEIVER_PORT))
+        logger.debug(f"✓ Forwarded to receiver at {RECEIVER_HOST}:{RECEIVER_PORT}")
+    except Exception as e:
+        logger.error(f"✗ Forward to receiver failed: {e}")
+
+    # -----------------------------
+    # Send metrics to analyzer (FIXED JSON SERIALIZATION)
+    # -----------------------------
+    try:
+        # Convert all MATLAB types to Python native types
+        metrics_dict = dict(metrics)  # Convert MATLAB struct to Python dict
+        metrics_serializable = {}
+
+        for key, value in metrics_dict.items():
+            metrics_serializable[key] = matlab_to_python(value)
+
+        sock_metrics.sendto(
+            _metrics_dumps(metrics_serializable),
+            (ANALYZER_HOST, ANALYZER_METRICS_PORT)
+        )
+        logger.debug("✓ Metrics sent to analyzer")
+    except Exception as e:
+        logger.error(f"✗ Metrics send failed: {e}")
+        # Log metrics dict for debugging
+        logger.error(f"  Debug - Metrics type: {type(metrics)}")
+        if isinstance(metrics, dict):
+            for k, v in metrics.items():
+                logger.error(f"  {k}: {v} (type: {type(v)})")
 
-        # -----------------------------
-        # Send metrics to analyzer (FIXED JSON SERIALIZATION)
-        # -----------------------------
+
+def _engine_worker(channel_eng):
+    """Drain the work queue through one dedicated MATLAB engine."""
+    while True:
+        packet_bytes = work_queue.get()
         try:
-            # Convert all MATLAB types to Python native types
-            metrics_dict = dict(metrics)  # Convert MATLAB struct to Python dict
-            metrics_serializable = {}
-            
-            for key, value in metrics_dict.items():
-                metrics_serializable[key] = matlab_to_python(value)
-            
-            metrics_json = json.dumps(metrics_serializable)
-            sock_metrics.sendto(
-                metrics_json.encode(),
-                (ANALYZER_HOST, ANALYZER_METRICS_PORT)
-            )
-            print(f"[Simulator] ✓ Metrics sent to analyzer")
+            process_packet(packet_bytes, channel_eng)
         except Exception as e:
-            print(f"[Simulator] ✗ Metrics send failed: {e}")
-            # Print metrics dict for debugging
-            print(f"[Simulator]   Debug - Metrics type: {type(metrics)}")
-            if isinstance(metrics, dict):
-                for k, v in metrics.items():
-                    print(f"[Simulator]   {k}: {v} (type: {type(v)})")
+            logger.error(f"✗ Worker error: {e}", exc_info=True)
+
+
+# --------------------------------------------------
+# Main loop
+# --------------------------------------------------
+packet_count = 0
+
+work_queue = None
+if len(engines) > 1:
+    # Bounded so a stalled engine exerts backpressure at the socket
+    # (kernel buffer) instead of growing an unbounded Python queue.
+    work_queue = queue.Queue(maxsize=1000)
+    for pooled_eng in engines:
+        threading.Thread(
+            target=_engine_worker, args=(pooled_eng,), daemon=True
+        ).start()
+    logger.info(f"Dispatching packets across {len(engines)} engine workers")
+
+while True:
+    try:
+        packet_bytes, addr = sock_in.recvfrom(BUFFER_SIZE)
+        packet_count += 1
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("════════════════════════════════════")
+            logger.debug(f"Packet #{packet_count}: Received {len(packet_bytes)} bytes from {addr}")
+
+        if work_queue is not None:
+            work_queue.put(packet_bytes)
+        else:
+            process_packet(packet_bytes, eng)
 
-        print(f"[Simulator] ════════════════════════════════════\n")
+        if packet_count % STATS_INTERVAL == 0:
+            logger.info(f"Processed {packet_count} packets")
 
     except KeyboardInterrupt:
-        print("\n[Simulator] Shutting down...")
+        logger.info("Shutting down...")
         break
     except Exception as e:
-        print(f"[Simulator] ✗ Unexpected error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.error(f"✗ Unexpected error: {e}", exc_info=True)
         continue
 
 # Cleanup
 sock_in.close()
 sock_out.close()
 sock_metrics.close()
-eng.quit()
-print("[Simulator] Stopped")
\ No newline at end of file
+for pooled_eng in engines:
+    pooled_eng.quit()
+logger.info("Stopped")
\ No newline at end of file
@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Tests for the batched UDP helpers and the packet buffer pool.
+"""
+import unittest
+import socket
+import time
+import sys
+import os
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from shared.net_utils import BatchReceiver, BatchSender, PacketBufferPool
+
+
+def _drain(receiver, expected, timeout=2.0):
+    """Collect datagrams from recv_batch until expected or timeout."""
+    results = []
+    deadline = time.monotonic() + timeout
+    while len(results) < expected and time.monotonic() < deadline:
+        results.extend(receiver.recv_batch())
+    return results
+
+
+class TestBatchTransfer(unittest.TestCase):
+    """Test sender/receiver loopback transfer."""
+
+    def setUp(self):
+        self.rx_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.rx_sock.bind(("127.0.0.1", 0))
+        self.rx_sock.settimeout(2.0)
+        self.rx_addr = self.rx_sock.getsockname()
+        self.tx_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+
+    def tearDown(self):
+        self.rx_sock.close()
+        self.tx_sock.close()
+
+    def test_send_receive_batch(self):
+        """Test a batch of datagrams arrives intact."""
+        datagrams = [f"packet-{i}".encode() * 10 for i in range(20)]
+        sender = BatchSender(self.tx_sock, batch_size=8)
+        receiver = BatchReceiver(self.rx_sock, batch_size=8)
+
+        sent = sender.send_batch(datagrams, self.rx_addr)
+        self.assertEqual(sent, len(datagrams))
+
+        results = _drain(receiver, len(datagrams))
+        self.assertEqual(
+            sorted(data for data, _ in results), sorted(datagrams)
+        )
+        for _, addr in results:
+            self.assertEqual(addr[0], "127.0.0.1")
+
+    def test_connected_socket_send(self):
+        """Test send_batch without an address on a connected socket."""
+        self.tx_sock.connect(self.rx_addr)
+        sender = BatchSender(self.tx_sock, batch_size=4)
+        receiver = BatchReceiver(self.rx_sock, batch_size=4)
+
+        datagrams = [b"connected-a", b"connected-b", b"connected-c"]
+        sent = sender.send_batch(datagrams)
+        self.assertEqual(sent, len(datagrams))
+
+        results = _drain(receiver, len(datagrams))
+        self.assertEqual(
+            sorted(data for data, _ in results), sorted(datagrams)
+        )
+
+    def test_pooled_receive(self):
+        """Test pool-backed receive yields releasable memoryviews."""
+        pool = PacketBufferPool(prealloc=4)
+        sender = BatchSender(self.tx_sock)
+        receiver = BatchReceiver(self.rx_sock, pool=pool)
+
+        datagrams = [b"pooled-%d" % i for i in range(6)]
+        sender.send_batch(datagrams, self.rx_addr)
+
+        results = _drain(receiver, len(datagrams))
+        payloads = []
+        for data, _ in results:
+            self.assertIsInstance(data, memoryview)
+            payloads.append(bytes(data))
+            pool.release(data)
+
+        self.assertEqual(sorted(payloads), sorted(datagrams))
+
+    def test_invalid_batch_size(self):
+        """Test batch size validation."""
+        with self.assertRaises(ValueError):
+            BatchSender(self.tx_sock, batch_size=0)
+        with self.assertRaises(ValueError):
+            BatchReceiver(self.rx_sock, batch_size=0)
+
+
+class TestPacketBufferPool(unittest.TestCase):
+    """Test the reusable buffer freelist."""
+
+    def test_acquire_release_recycles(self):
+        """Test released buffers are handed out again."""
+        pool = PacketBufferPool(buffer_size=128, prealloc=1)
+
+        buf = pool.acquire()
+        self.assertEqual(len(buf), 128)
+        pool.release(buf)
+        self.assertIs(pool.acquire(), buf)
+
+    def test_empty_pool_allocates(self):
+        """Test acquire never blocks when the freelist is empty."""
+        pool = PacketBufferPool(buffer_size=64, prealloc=1)
+
+        first = pool.acquire()
+        second = pool.acquire()  # freelist exhausted
+        self.assertEqual(len(second), 64)
+        self.assertIsNot(first, second)
+
+    def test_release_memoryview(self):
+        """Test releasing a memoryview returns its backing buffer."""
+        pool = PacketBufferPool(buffer_size=32, prealloc=1)
+
+        buf = pool.acquire()
+        pool.release(memoryview(buf)[:10])
+        self.assertIs(pool.acquire(), buf)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Tests for the sample-level RF pipeline helpers.
+"""
+import unittest
+import tempfile
+import sys
+import os
+
+import numpy as np
+
+# Add parent directory to path
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..'))
+
+from simulator.rf_pipeline import (
+    qpsk_modulate,
+    qpsk_modulate_bytes,
+    qpsk_demodulate,
+    qpsk_demodulate_to_bytes,
+    bytes_to_bits,
+    bits_to_bytes,
+    save_iq,
+    load_iq,
+    save_iq_int16,
+    load_iq_int16,
+    ChannelEmulator,
+)
+
+
+class TestBitConversion(unittest.TestCase):
+    """Test bit/byte stream conversion."""
+
+    def test_bits_roundtrip(self):
+        """Test bytes -> bits -> bytes roundtrip."""
+        payload = bytes(range(256))
+        bits = bytes_to_bits(payload)
+
+        self.assertEqual(bits.size, 8 * len(payload))
+        self.assertTrue(set(np.unique(bits)) <= {0, 1})
+        self.assertEqual(bits_to_bytes(bits), payload)
+
+    def test_bit_ordering(self):
+        """Test MSB-first ordering matches format(byte, '08b')."""
+        bits = bytes_to_bits(b"\xA5")
+        expected = [int(c) for c in format(0xA5, '08b')]
+        self.assertEqual(list(bits), expected)
+
+    def test_invalid_bit_count(self):
+        """Test non-multiple-of-8 bit streams are rejected."""
+        with self.assertRaises(ValueError):
+            bits_to_bytes(np.zeros(7, dtype=np.uint8))
+
+
+class TestQPSK(unittest.TestCase):
+    """Test QPSK modulation and demodulation."""
+
+    def test_modulate_demodulate_roundtrip(self):
+        """Test a noiseless modulate/demodulate roundtrip."""
+        payload = b"QPSK roundtrip test payload" * 4
+        symbols = qpsk_modulate_bytes(payload)
+
+        self.assertEqual(symbols.size, 4 * len(payload))
+        # Unit average power constellation
+        self.assertAlmostEqual(
+            float(np.mean(np.abs(symbols) ** 2)), 1.0, places=5
+        )
+        self.assertEqual(qpsk_demodulate_to_bytes(symbols), payload)
+
+    def test_byte_lut_matches_bit_path(self):
+        """Test the byte-LUT modulator agrees with the bit modulator."""
+        payload = bytes(range(256))
+        via_bytes = qpsk_modulate_bytes(payload)
+        via_bits = qpsk_modulate(bytes_to_bits(payload))
+
+        np.testing.assert_array_equal(via_bytes, via_bits)
+
+    def test_demodulate_matches_byte_path(self):
+        """Test bit-level demodulation agrees with the byte packer."""
+        payload = b"demod agreement"
+        symbols = qpsk_modulate_bytes(payload)
+
+        bits = qpsk_demodulate(symbols)
+        self.assertEqual(bits_to_bytes(bits), payload)
+
+    def test_invalid_lengths(self):
+        """Test odd bit counts and non-multiple-of-4 samples raise."""
+        with self.assertRaises(ValueError):
+            qpsk_modulate(np.zeros(3, dtype=np.uint8))
+        with self.assertRaises(ValueError):
+            qpsk_demodulate_to_bytes(np.zeros(5, dtype=np.complex64))
+
+
+class TestIQFiles(unittest.TestCase):
+    """Test I/Q sample file round trips."""
+
+    def test_float32_roundtrip(self):
+        """Test save_iq/load_iq preserves samples exactly."""
+        samples = qpsk_modulate_bytes(b"iq file test")
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "samples.iq")
+            save_iq(samples, path)
+            loaded = load_iq(path)
+
+        np.testing.assert_array_equal(loaded, samples)
+
+    def test_int16_roundtrip(self):
+        """Test the Q.15 format restores the original scale."""
+        rng = np.random.default_rng(7)
+        samples = (
+            rng.standard_normal(256) + 1j * rng.standard_normal(256)
+        ).astype(np.complex64) * 3.5
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "samples.iq16")
+            save_iq_int16(samples, path)
+            loaded = load_iq_int16(path)
+
+        self.assertEqual(loaded.dtype, np.complex64)
+        np.testing.assert_allclose(loaded, samples, atol=1e-3)
+
+
+class TestChannelEmulator(unittest.TestCase):
+    """Test the sample-level channel emulator."""
+
+    def test_high_snr_recovers_payload(self):
+        """Test the full chain is error-free at high SNR."""
+        payload = b"channel emulator end to end" * 8
+        emulator = ChannelEmulator(snr_db=30.0, rng_seed=42)
+
+        received = emulator.process(payload)
+
+        self.assertEqual(received.dtype, np.complex64)
+        self.assertEqual(qpsk_demodulate_to_bytes(received), payload)
+
+    def test_noise_power_matches_snr(self):
+        """Test the injected noise power tracks the configured SNR."""
+        emulator = ChannelEmulator(snr_db=10.0, rng_seed=1)
+        signal = np.zeros(200_000, dtype=np.complex64)
+
+        noise = emulator.apply_awgn(signal)
+
+        measured = float(np.mean(np.abs(noise) ** 2))
+        # Expected noise power is 1/snr_linear = 0.1
+        self.assertLess(abs(measured - 0.1), 0.1 * 0.05)
+
+    def test_freq_offset_rotation(self):
+        """Test the cached rotator applies exp(j*2*pi*f0*n)."""
+        emulator = ChannelEmulator(freq_offset=0.01)
+        signal = np.ones(64, dtype=np.complex64)
+
+        rotated = emulator.apply_freq_offset(signal)
+
+        n = np.arange(64)
+        expected = np.exp(2j * np.pi * 0.01 * n).astype(np.complex64)
+        np.testing.assert_allclose(rotated, expected, atol=1e-5)
+
+    def test_single_tap_multipath_is_identity(self):
+        """Test a unit single-tap profile leaves the signal unchanged."""
+        emulator = ChannelEmulator(taps=[1.0])
+        signal = qpsk_modulate_bytes(b"single tap")
+
+        filtered = emulator.apply_multipath(signal)
+
+        np.testing.assert_allclose(filtered, signal, atol=1e-6)
+
+
+if __name__ == '__main__':
+    unittest.main()
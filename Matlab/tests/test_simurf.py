@@ -104,6 +104,15 @@ class TestCrypto(unittest.TestCase):
         
         self.assertEqual(plaintext, decrypted)
     
+    def test_large_payload_roundtrip(self):
+        """Test payloads above the vectorized-XOR threshold."""
+        # Exercises the NumPy/numba keystream path, which only engages
+        # for payloads >= 64 bytes
+        for size in (64, 200, 5000):
+            plaintext = bytes(range(256)) * (size // 256 + 1)
+            plaintext = plaintext[:size]
+            self.assertEqual(decrypt(encrypt(plaintext)), plaintext)
+
     def test_invalid_data(self):
         """Test decryption of invalid data."""
         with self.assertRaises(ValueError):
@@ -189,6 +198,45 @@ class TestMetrics(unittest.TestCase):
         self.assertIn('kbps', stats)
 
 
+class TestChannelSimulator(unittest.TestCase):
+    """Test the pure-Python fallback channel."""
+
+    def test_simulated_ber_matches_theory(self):
+        """Measured BER over a large payload tracks the BPSK formula."""
+        from simulator.channel_sim import SimpleChannelSimulator
+
+        sim = SimpleChannelSimulator({"snr_db": 5.0, "rng_seed": 1234})
+        payload = bytes(1_000_000)
+
+        impaired, metrics = sim.simulate(payload)
+
+        expected = sim.ber  # theoretical BER for 5 dB (~0.006)
+        measured = metrics['ber']
+        self.assertGreater(expected, 0.0)
+        # 8M bits: the sample BER should land within 10% of theory
+        self.assertLess(abs(measured - expected), expected * 0.1)
+
+        # The reported error count must match the actual bit flips
+        import numpy as np
+        diff = np.frombuffer(payload, dtype=np.uint8) ^ np.frombuffer(
+            impaired, dtype=np.uint8
+        )
+        actual_flips = int(np.unpackbits(diff).sum())
+        self.assertEqual(metrics['bit_errors'], actual_flips)
+
+    def test_clean_channel_passthrough(self):
+        """At very high SNR the payload passes through untouched."""
+        from simulator.channel_sim import SimpleChannelSimulator
+
+        sim = SimpleChannelSimulator({"snr_db": 40.0})
+        payload = b"clean channel" * 10
+
+        impaired, metrics = sim.simulate(payload)
+
+        self.assertEqual(impaired, payload)
+        self.assertEqual(metrics['bit_errors'], 0)
+
+
 class TestIntegration(unittest.TestCase):
     """Integration tests for full workflow."""
     
@@ -1,6 +1,13 @@
 import socket
 import json
 
+# orjson decodes the metric datagrams straight from bytes, several
+# times faster than stdlib json plus a per-packet .decode()
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
 LISTEN_IP = "0.0.0.0"
 METRICS_PORT = 7000
 BUFFER_SIZE = 65535
@@ -13,7 +20,7 @@ print("[Analyzer] Listening for metrics on port 7000", flush=True)
 while True:
     data, addr = sock.recvfrom(BUFFER_SIZE)
 
-    metrics = json.loads(data.decode())
+    metrics = json_loads(data)
 
     print(
         f"[Analyzer] Metrics received: {metrics}",
@@ -1,11 +1,28 @@
+import os
 import socket
 import sys
+import logging
 
 from shared.packet_format import unpack
 from shared.crypto_utils import decrypt
 from shared.fec_utils import fec_decode
 from shared.config_utils import load_simurf_config
 
+# --------------------------------------------------
+# Logging: per-packet detail is DEBUG-only so the hot loop skips the
+# string formatting and stdout write entirely at the default level.
+# Set SIMURF_VERBOSE=1 to restore the packet-by-packet trace.
+# --------------------------------------------------
+logging.basicConfig(
+    level=logging.DEBUG if os.environ.get("SIMURF_VERBOSE") else logging.INFO,
+    format='[%(asctime)s] [Receiver] %(levelname)s: %(message)s',
+    datefmt='%H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+# Emit an INFO progress line every this many packets
+STATS_INTERVAL = 100
+
 # --------------------------------------------------
 # Load configuration
 # --------------------------------------------------
@@ -13,7 +30,7 @@ try:
     cfg = load_simurf_config()
     USE_FEC = cfg.get("use_fec", False)
 except Exception as e:
-    print(f"[Receiver] WARNING: Could not load config: {e}")
+    logger.warning(f"Could not load config: {e}")
     USE_FEC = False
 
 # --------------------------------------------------
@@ -32,14 +49,13 @@ sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
 
 try:
     sock.bind((LISTEN_IP, LISTEN_PORT))
-    print("=" * 60)
-    print(f"[Receiver] ✓ Successfully bound to {LISTEN_IP}:{LISTEN_PORT}")
-    print(f"[Receiver] FEC enabled: {USE_FEC}")
-    print(f"[Receiver] Waiting for packets...")
-    print("=" * 60)
-    sys.stdout.flush()
+    logger.info("=" * 60)
+    logger.info(f"✓ Successfully bound to {LISTEN_IP}:{LISTEN_PORT}")
+    logger.info(f"FEC enabled: {USE_FEC}")
+    logger.info("Waiting for packets...")
+    logger.info("=" * 60)
 except Exception as e:
-    print(f"[Receiver] ✗ ERROR: Could not bind socket: {e}")
+    logger.error(f"✗ ERROR: Could not bind socket: {e}")
     sys.exit(1)
 
 # --------------------------------------------------
@@ -57,77 +73,79 @@ while True:
     try:
         data, addr = sock.recvfrom(BUFFER_SIZE)
         packet_count += 1
-        
-        # Always print raw receipt
-        print(f"\n[Receiver] ════════════════════════════════════")
-        print(f"[Receiver] Packet #{packet_count}: Received from {addr}")
-        print(f"[Receiver] Raw size: {len(data)} bytes")
-        sys.stdout.flush()
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("════════════════════════════════════")
+            logger.debug(f"Packet #{packet_count}: Received from {addr}")
+            logger.debug(f"Raw size: {len(data)} bytes")
 
         try:
             # -----------------------------
             # Unpack + CRC validation
             # -----------------------------
             pkt = unpack(data)
-            print(f"[Receiver] ✓ CRC valid, SEQ={pkt['seq']}")
-            print(f"[Receiver]   SRC={pkt['src_ip']} → DST={pkt['dst_ip']}")
-            print(f"[Receiver]   Payload size: {len(pkt['payload'])} bytes")
-            
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"✓ CRC valid, SEQ={pkt['seq']}")
+                logger.debug(f"  SRC={pkt['src_ip']} → DST={pkt['dst_ip']}")
+                logger.debug(f"  Payload size: {len(pkt['payload'])} bytes")
+
             payload = pkt["payload"]
 
             # -----------------------------
             # Optional FEC decoding
             # -----------------------------
             if USE_FEC:
-                print(f"[Receiver] → Decoding FEC...")
                 try:
                     payload = fec_decode(payload, repeat=3)
-                    print(f"[Receiver] ✓ FEC decoded: {len(payload)} bytes")
+                    logger.debug(f"✓ FEC decoded: {len(payload)} bytes")
                 except Exception as e:
-                    print(f"[Receiver] ✗ FEC decode failed: {e}")
+                    logger.error(f"✗ FEC decode failed: {e}")
                     raise
 
             # -----------------------------
             # Decrypt payload
             # -----------------------------
-            print(f"[Receiver] → Decrypting...")
             try:
                 plaintext = decrypt(payload)
-                print(f"[Receiver] ✓ Decrypted: {len(plaintext)} bytes")
+                logger.debug(f"✓ Decrypted: {len(plaintext)} bytes")
             except Exception as e:
-                print(f"[Receiver] ✗ Decryption failed: {e}")
+                logger.error(f"✗ Decryption failed: {e}")
                 raise
 
             # -----------------------------
-            # Decode message
+            # Decode message (trace only; the decoded string is
+            # otherwise unused)
             # -----------------------------
             try:
-                msg = plaintext.decode(errors="replace")
-                print(f"[Receiver] ✓ MESSAGE: '{msg}'")
+                if logger.isEnabledFor(logging.DEBUG):
+                    msg = plaintext.decode(errors="replace")
+                    logger.debug(f"✓ MESSAGE: '{msg}'")
                 success_count += 1
             except Exception as e:
-                print(f"[Receiver] ✗ UTF-8 decode failed: {e}")
-                print(f"[Receiver]   Raw bytes: {plaintext[:50]}...")
+                logger.error(f"✗ UTF-8 decode failed: {e}")
+                logger.error(f"  Raw bytes: {plaintext[:50]}...")
                 raise
 
         except ValueError as e:
             # CRC or length corruption
             crc_errors += 1
-            print(f"[Receiver] ✗ CORRUPTED (CRC/length): {e}")
+            logger.error(f"✗ CORRUPTED (CRC/length): {e}")
 
         except Exception as e:
             # Any other decode issue
             decode_errors += 1
-            print(f"[Receiver] ✗ DECODE ERROR: {e}")
+            logger.error(f"✗ DECODE ERROR: {e}")
+
+        logger.debug("════════════════════════════════════")
 
-        # Print statistics
-        print(f"[Receiver] Stats: {success_count} OK | {crc_errors} CRC | {decode_errors} Decode")
-        print(f"[Receiver] ════════════════════════════════════\n")
-        sys.stdout.flush()
+        if packet_count % STATS_INTERVAL == 0:
+            logger.info(f"Stats: {success_count} OK | {crc_errors} CRC | "
+                        f"{decode_errors} Decode ({packet_count} total)")
 
     except KeyboardInterrupt:
-        print("\n[Receiver] Shutting down...")
+        logger.info("Shutting down...")
+        logger.info(f"Final: {success_count} OK | {crc_errors} CRC | "
+                    f"{decode_errors} Decode ({packet_count} total)")
         break
     except Exception as e:
-        print(f"[Receiver] ✗ Unexpected error in main loop: {e}")
-        sys.stdout.flush()
\ No newline at end of file
+        logger.error(f"✗ Unexpected error in main loop: {e}")
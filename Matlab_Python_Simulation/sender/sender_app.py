@@ -58,63 +58,74 @@ time.sleep(5)  # Give simulator time to initialize
 # --------------------------------------------------
 seq = 0
 
+# One socket for the whole run: creating and closing a socket per
+# packet costs two extra syscalls each time for no benefit on UDP.
+# Resolve the Docker service name once and connect() so each send
+# skips name resolution and per-packet route lookup in the kernel.
+sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+simulator_addr = socket.getaddrinfo(
+    SIMULATOR_HOST, SIMULATOR_PORT, socket.AF_INET, socket.SOCK_DGRAM
+)[0][4]
+sock.connect(simulator_addr)
+
 print("=" * 60)
 print("[Sender] Starting SimURF Wireless Transmission")
 print(f"[Sender] Target: {SIMULATOR_HOST}:{SIMULATOR_PORT} (Containerized MATLAB Simulator)")
 print(f"[Sender] FEC enabled: {USE_FEC}")
 print("=" * 60)
 
-for batch_name, messages in MESSAGE_BATCHES.items():
-    print(f"\n[Sender] ╔══════ Batch: {batch_name} ══════╗")
-
-    for msg in messages:
-        timestamp_ns = time.time_ns()
-
-        print(f"\n[Sender] Packet #{seq}")
-        print(f"[Sender] Original message: '{msg}'")
-
-        # -----------------------------
-        # Encrypt
-        # -----------------------------
-        ciphertext = encrypt(msg.encode())
-        print(f"[Sender] → Encrypted: {len(ciphertext)} bytes")
-
-        # -----------------------------
-        # Optional FEC
-        # -----------------------------
-        if USE_FEC:
-            payload = fec_encode(ciphertext, repeat=3)
-            print(f"[Sender] → FEC encoded: {len(payload)} bytes (3x repetition)")
-        else:
-            payload = ciphertext
-            print(f"[Sender] → No FEC (disabled)")
-
-        # -----------------------------
-        # Pack application packet
-        # -----------------------------
-        pkt_bytes = pack(
-            seq=seq,
-            src_ip=SRC_IP,
-            dst_ip=DST_IP,
-            timestamp_ns=timestamp_ns,
-            payload=payload
-        )
-        print(f"[Sender] → Packed: {len(pkt_bytes)} bytes total")
-
-        # -----------------------------
-        # Send to simulator container
-        # -----------------------------
-        try:
-            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            sock.sendto(pkt_bytes, (SIMULATOR_HOST, SIMULATOR_PORT))
-            sock.close()
-            
-            print(f"[Sender] ✓ Sent to simulator at {SIMULATOR_HOST}:{SIMULATOR_PORT}")
-        except Exception as e:
-            print(f"[Sender] ✗ Send failed: {e}")
-
-        seq += 1
-        time.sleep(0.5)
+try:
+    for batch_name, messages in MESSAGE_BATCHES.items():
+        print(f"\n[Sender] ╔══════ Batch: {batch_name} ══════╗")
+
+        for msg in messages:
+            timestamp_ns = time.time_ns()
+
+            print(f"\n[Sender] Packet #{seq}")
+            print(f"[Sender] Original message: '{msg}'")
+
+            # -----------------------------
+            # Encrypt
+            # -----------------------------
+            ciphertext = encrypt(msg.encode())
+            print(f"[Sender] → Encrypted: {len(ciphertext)} bytes")
+
+            # -----------------------------
+            # Optional FEC
+            # -----------------------------
+            if USE_FEC:
+                payload = fec_encode(ciphertext, repeat=3)
+                print(f"[Sender] → FEC encoded: {len(payload)} bytes (3x repetition)")
+            else:
+                payload = ciphertext
+                print(f"[Sender] → No FEC (disabled)")
+
+            # -----------------------------
+            # Pack application packet
+            # -----------------------------
+            pkt_bytes = pack(
+                seq=seq,
+                src_ip=SRC_IP,
+                dst_ip=DST_IP,
+                timestamp_ns=timestamp_ns,
+                payload=payload
+            )
+            print(f"[Sender] → Packed: {len(pkt_bytes)} bytes total")
+
+            # -----------------------------
+            # Send to simulator container
+            # -----------------------------
+            try:
+                sock.send(pkt_bytes)
+
+                print(f"[Sender] ✓ Sent to simulator at {SIMULATOR_HOST}:{SIMULATOR_PORT}")
+            except Exception as e:
+                print(f"[Sender] ✗ Send failed: {e}")
+
+            seq += 1
+            time.sleep(0.5)
+finally:
+    sock.close()
 
 print("\n" + "=" * 60)
 print("[Sender] All packets sent")
@@ -1,9 +1,21 @@
 import os
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 KEY = b"simurf-secret-key"
 
+# Below this size the NumPy call overhead exceeds the Python loop cost
+_XOR_VECTOR_MIN = 64
+
 def _xor(data: bytes, key: bytes) -> bytes:
-    return bytes(b ^ key[i % len(key)] for i, b in enumerate(data))
+    if np is None or len(data) < _XOR_VECTOR_MIN:
+        return bytes(b ^ key[i % len(key)] for i, b in enumerate(data))
+    # Tile the keystream and XOR in one vectorized uint8 pass
+    ks = np.resize(np.frombuffer(key, dtype=np.uint8), len(data))
+    return np.bitwise_xor(np.frombuffer(data, dtype=np.uint8), ks).tobytes()
 
 def encrypt(data: bytes) -> bytes:
     nonce = os.urandom(4)
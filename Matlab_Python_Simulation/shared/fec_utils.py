@@ -1,9 +1,18 @@
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
 def fec_encode(data: bytes, repeat: int = 3) -> bytes:
     """
     Simple repetition-code FEC.
     Each byte is repeated `repeat` times.
     """
-    return b"".join(bytes([b]) * repeat for b in data)
+    if np is None:
+        return b"".join(bytes([b]) * repeat for b in data)
+    # One C-level expansion instead of a tiny allocation per byte
+    return np.repeat(np.frombuffer(data, dtype=np.uint8), repeat).tobytes()
 
 
 def fec_decode(data: bytes, repeat: int = 3) -> bytes:
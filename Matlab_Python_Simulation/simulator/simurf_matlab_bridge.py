@@ -2,10 +2,26 @@ import os
 import sys
 import json
 import socket
+import logging
 
 # Import compiled MATLAB package
 import rf_channel_pkg
 
+# --------------------------------------------------
+# Logging: per-packet detail is DEBUG-only so the hot loop skips the
+# string formatting and stdout write entirely at the default level.
+# Set SIMURF_VERBOSE=1 to restore the packet-by-packet trace.
+# --------------------------------------------------
+logging.basicConfig(
+    level=logging.DEBUG if os.environ.get("SIMURF_VERBOSE") else logging.INFO,
+    format='[%(asctime)s] [Simulator] %(levelname)s: %(message)s',
+    datefmt='%H:%M:%S'
+)
+logger = logging.getLogger(__name__)
+
+# Emit an INFO progress line every this many packets
+STATS_INTERVAL = 100
+
 # --------------------------------------------------
 # Path setup
 # --------------------------------------------------
@@ -19,7 +35,7 @@ from shared.packet_format import unpack, pack
 # --------------------------------------------------
 CONFIG_PATH = os.path.join(SCRIPT_DIR, "config", "matlab_channel_config.json")
 
-print(f"[Simulator] Config path: {CONFIG_PATH}")
+logger.info(f"Config path: {CONFIG_PATH}")
 
 with open(CONFIG_PATH) as f:
     channel_cfg = json.load(f)
@@ -40,13 +56,13 @@ ANALYZER_PORT = 7000
 
 BUFFER_SIZE = 65535
 
-print(f"[Simulator] Receiver target: {RECEIVER_HOST}:{RECEIVER_PORT}")
-print(f"[Simulator] Analyzer target: {ANALYZER_HOST}:{ANALYZER_PORT}")
+logger.info(f"Receiver target: {RECEIVER_HOST}:{RECEIVER_PORT}")
+logger.info(f"Analyzer target: {ANALYZER_HOST}:{ANALYZER_PORT}")
 
 # --------------------------------------------------
 # Initialize MATLAB Runtime and RF channel
 # --------------------------------------------------
-print("[Simulator] Initializing MATLAB Runtime and RF channel...")
+logger.info("Initializing MATLAB Runtime and RF channel...")
 try:
     # Initialize the compiled MATLAB package
     rf_pkg = rf_channel_pkg.initialize()
@@ -54,14 +70,12 @@ try:
     # Initialize channel configuration
     rf_pkg.init_channel(channel_cfg, nargout=0)
     
-    print("[Simulator] MATLAB RF channel initialized")
-    print(f"[Simulator] Channel config: SNR={channel_cfg['snr_db']} dB, "
-          f"Doppler={channel_cfg['doppler_shift']} Hz, "
-          f"Model={channel_cfg['channel_model']}")
+    logger.info("MATLAB RF channel initialized")
+    logger.info(f"Channel config: SNR={channel_cfg['snr_db']} dB, "
+                f"Doppler={channel_cfg['doppler_shift']} Hz, "
+                f"Model={channel_cfg['channel_model']}")
 except Exception as e:
-    print(f"[Simulator] ERROR initializing MATLAB Runtime: {e}")
-    import traceback
-    traceback.print_exc()
+    logger.error(f"ERROR initializing MATLAB Runtime: {e}", exc_info=True)
     sys.exit(1)
 
 # --------------------------------------------------
@@ -73,9 +87,9 @@ sock_in.bind((LISTEN_IP, LISTEN_PORT))
 sock_out = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
 sock_metrics = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
 
-print(f"[Simulator] Listening on {LISTEN_IP}:{LISTEN_PORT}")
-print("[Simulator] Ready to process packets...")
-print("=" * 60)
+logger.info(f"Listening on {LISTEN_IP}:{LISTEN_PORT}")
+logger.info("Ready to process packets...")
+logger.info("=" * 60)
 
 # --------------------------------------------------
 # Helper function to convert MATLAB types to Python
@@ -100,47 +114,48 @@ while True:
     try:
         packet_bytes, addr = sock_in.recvfrom(BUFFER_SIZE)
         packet_count += 1
-        print(f"\n[Simulator] ╔════════════════════════════════════╗")
-        print(f"[Simulator] Packet #{packet_count}: Received {len(packet_bytes)} bytes from {addr}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("╔════════════════════════════════════╗")
+            logger.debug(f"Packet #{packet_count}: Received {len(packet_bytes)} bytes from {addr}")
 
         # -----------------------------
         # Unpack packet (CRC-safe)
         # -----------------------------
         try:
             pkt = unpack(packet_bytes)
-            print(f"[Simulator] ✓ Unpacked: SEQ={pkt['seq']}, payload={len(pkt['payload'])} bytes")
+            logger.debug(f"✓ Unpacked: SEQ={pkt['seq']}, payload={len(pkt['payload'])} bytes")
         except Exception as e:
-            print(f"[Simulator] ✗ Unpack failed: {e}")
+            logger.error(f"✗ Unpack failed: {e}")
             continue
 
         # -----------------------------
         # Apply RF channel to payload only
         # -----------------------------
         try:
-            # Convert payload to list for MATLAB
-            tx_payload = list(pkt["payload"])
-            print(f"[Simulator] → Applying RF channel (MATLAB Runtime)...")
-            
+            # bytearray is an int sequence MATLAB accepts directly,
+            # without materializing a list of boxed Python ints
+            tx_payload = bytearray(pkt["payload"])
+            logger.debug("→ Applying RF channel (MATLAB Runtime)...")
+
             # Call compiled MATLAB function
             rx_payload, metrics = rf_pkg.rf_emulator(tx_payload, nargout=2)
+
+            # Convert MATLAB output back to bytes (no per-byte int() boxing)
+            rx_payload_bytes = bytes(bytearray(rx_payload))
             
-            # Convert MATLAB output back to bytes
-            rx_payload_bytes = bytes([int(b) for b in rx_payload])
-            
-            print(f"[Simulator] ✓ RF emulation complete")
-            print(f"[Simulator]   SNR: {metrics['snr_db']} dB, Doppler: {metrics['doppler']} Hz")
-            
-            # Show BER if available
-            if 'ber' in metrics:
-                ber = matlab_to_python(metrics['ber'])
-                bit_errors = matlab_to_python(metrics.get('bit_errors', 0))
-                bytes_total = matlab_to_python(metrics.get('bytes_total', 0))
-                print(f"[Simulator]   BER: {ber:.6f} ({bit_errors}/{bytes_total*8} bits)")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("✓ RF emulation complete")
+                logger.debug(f"  SNR: {metrics['snr_db']} dB, Doppler: {metrics['doppler']} Hz")
+
+                # Show BER if available
+                if 'ber' in metrics:
+                    ber = matlab_to_python(metrics['ber'])
+                    bit_errors = matlab_to_python(metrics.get('bit_errors', 0))
+                    bytes_total = matlab_to_python(metrics.get('bytes_total', 0))
+                    logger.debug(f"  BER: {ber:.6f} ({bit_errors}/{bytes_total*8} bits)")
             
         except Exception as e:
-            print(f"[Simulator] ✗ MATLAB RF emulation failed: {e}")
-            import traceback
-            traceback.print_exc()
+            logger.error(f"✗ MATLAB RF emulation failed: {e}", exc_info=True)
             continue
 
         # -----------------------------
@@ -154,9 +169,9 @@ while True:
                 pkt["timestamp_ns"],
                 rx_payload_bytes
             )
-            print(f"[Simulator] ✓ Re-packed: {len(new_packet)} bytes")
+            logger.debug(f"✓ Re-packed: {len(new_packet)} bytes")
         except Exception as e:
-            print(f"[Simulator] ✗ Re-pack failed: {e}")
+            logger.error(f"✗ Re-pack failed: {e}")
             continue
 
         # -----------------------------
@@ -164,9 +179,9 @@ while True:
         # -----------------------------
         try:
             sock_out.sendto(new_packet, (RECEIVER_HOST, RECEIVER_PORT))
-            print(f"[Simulator] ✓ Forwarded to receiver at {RECEIVER_HOST}:{RECEIVER_PORT}")
+            logger.debug(f"✓ Forwarded to receiver at {RECEIVER_HOST}:{RECEIVER_PORT}")
         except Exception as e:
-            print(f"[Simulator] ✗ Forward to receiver failed: {e}")
+            logger.error(f"✗ Forward to receiver failed: {e}")
 
         # -----------------------------
         # Send metrics to analyzer
@@ -183,19 +198,20 @@ while True:
                 metrics_json.encode(),
                 (ANALYZER_HOST, ANALYZER_PORT)
             )
-            print(f"[Simulator] ✓ Metrics sent to analyzer")
+            logger.debug("✓ Metrics sent to analyzer")
         except Exception as e:
-            print(f"[Simulator] ✗ Metrics send failed: {e}")
+            logger.error(f"✗ Metrics send failed: {e}")
+
+        logger.debug("╚════════════════════════════════════╝")
 
-        print(f"[Simulator] ╚════════════════════════════════════╝\n")
+        if packet_count % STATS_INTERVAL == 0:
+            logger.info(f"Processed {packet_count} packets")
 
     except KeyboardInterrupt:
-        print("\n[Simulator] Shutting down...")
+        logger.info("Shutting down...")
         break
     except Exception as e:
-        print(f"[Simulator] ✗ Unexpected error: {e}")
-        import traceback
-        traceback.print_exc()
+        logger.error(f"✗ Unexpected error: {e}", exc_info=True)
         continue
 
 # Cleanup
@@ -203,4 +219,4 @@ sock_in.close()
 sock_out.close()
 sock_metrics.close()
 rf_pkg.terminate()
-print("[Simulator] Stopped")
\ No newline at end of file
+logger.info("Stopped")
\ No newline at end of file